@@ -38,3 +38,258 @@ PLAYABLE_MEDIA_TYPES = [
 ]
 
 NO_HOLIDAY = "No holiday"
+
+# Hemisphere of each country by ISO 3166-1 alpha-2 code, based on the latitude
+# of the country's centroid
+COUNTRY_HEMISPHERE = {
+    "AD": "Northern",
+    "AE": "Northern",
+    "AF": "Northern",
+    "AG": "Northern",
+    "AI": "Northern",
+    "AL": "Northern",
+    "AM": "Northern",
+    "AO": "Southern",
+    "AQ": "Southern",
+    "AR": "Southern",
+    "AS": "Southern",
+    "AT": "Northern",
+    "AU": "Southern",
+    "AW": "Northern",
+    "AX": "Northern",
+    "AZ": "Northern",
+    "BA": "Northern",
+    "BB": "Northern",
+    "BD": "Northern",
+    "BE": "Northern",
+    "BF": "Northern",
+    "BG": "Northern",
+    "BH": "Northern",
+    "BI": "Southern",
+    "BJ": "Northern",
+    "BL": "Northern",
+    "BM": "Northern",
+    "BN": "Northern",
+    "BO": "Southern",
+    "BQ": "Northern",
+    "BR": "Southern",
+    "BS": "Northern",
+    "BT": "Northern",
+    "BV": "Southern",
+    "BW": "Southern",
+    "BY": "Northern",
+    "BZ": "Northern",
+    "CA": "Northern",
+    "CC": "Southern",
+    "CD": "Southern",
+    "CF": "Northern",
+    "CG": "Southern",
+    "CH": "Northern",
+    "CI": "Northern",
+    "CK": "Southern",
+    "CL": "Southern",
+    "CM": "Northern",
+    "CN": "Northern",
+    "CO": "Northern",
+    "CR": "Northern",
+    "CU": "Northern",
+    "CV": "Northern",
+    "CW": "Northern",
+    "CX": "Southern",
+    "CY": "Northern",
+    "CZ": "Northern",
+    "DE": "Northern",
+    "DJ": "Northern",
+    "DK": "Northern",
+    "DM": "Northern",
+    "DO": "Northern",
+    "DZ": "Northern",
+    "EC": "Southern",
+    "EE": "Northern",
+    "EG": "Northern",
+    "EH": "Northern",
+    "ER": "Northern",
+    "ES": "Northern",
+    "ET": "Northern",
+    "FI": "Northern",
+    "FJ": "Southern",
+    "FK": "Southern",
+    "FM": "Northern",
+    "FO": "Northern",
+    "FR": "Northern",
+    "GA": "Southern",
+    "GB": "Northern",
+    "GD": "Northern",
+    "GE": "Northern",
+    "GF": "Northern",
+    "GG": "Northern",
+    "GH": "Northern",
+    "GI": "Northern",
+    "GL": "Northern",
+    "GM": "Northern",
+    "GN": "Northern",
+    "GP": "Northern",
+    "GQ": "Northern",
+    "GR": "Northern",
+    "GS": "Southern",
+    "GT": "Northern",
+    "GU": "Northern",
+    "GW": "Northern",
+    "GY": "Northern",
+    "HK": "Northern",
+    "HM": "Southern",
+    "HN": "Northern",
+    "HR": "Northern",
+    "HT": "Northern",
+    "HU": "Northern",
+    "ID": "Southern",
+    "IE": "Northern",
+    "IL": "Northern",
+    "IM": "Northern",
+    "IN": "Northern",
+    "IO": "Southern",
+    "IQ": "Northern",
+    "IR": "Northern",
+    "IS": "Northern",
+    "IT": "Northern",
+    "JE": "Northern",
+    "JM": "Northern",
+    "JO": "Northern",
+    "JP": "Northern",
+    "KE": "Northern",
+    "KG": "Northern",
+    "KH": "Northern",
+    "KI": "Southern",
+    "KM": "Southern",
+    "KN": "Northern",
+    "KP": "Northern",
+    "KR": "Northern",
+    "KW": "Northern",
+    "KY": "Northern",
+    "KZ": "Northern",
+    "LA": "Northern",
+    "LB": "Northern",
+    "LC": "Northern",
+    "LI": "Northern",
+    "LK": "Northern",
+    "LR": "Northern",
+    "LS": "Southern",
+    "LT": "Northern",
+    "LU": "Northern",
+    "LV": "Northern",
+    "LY": "Northern",
+    "MA": "Northern",
+    "MC": "Northern",
+    "MD": "Northern",
+    "ME": "Northern",
+    "MF": "Northern",
+    "MG": "Southern",
+    "MH": "Northern",
+    "MK": "Northern",
+    "ML": "Northern",
+    "MM": "Northern",
+    "MN": "Northern",
+    "MO": "Northern",
+    "MP": "Northern",
+    "MQ": "Northern",
+    "MR": "Northern",
+    "MS": "Northern",
+    "MT": "Northern",
+    "MU": "Southern",
+    "MV": "Northern",
+    "MW": "Southern",
+    "MX": "Northern",
+    "MY": "Northern",
+    "MZ": "Southern",
+    "NA": "Southern",
+    "NC": "Southern",
+    "NE": "Northern",
+    "NF": "Southern",
+    "NG": "Northern",
+    "NI": "Northern",
+    "NL": "Northern",
+    "NO": "Northern",
+    "NP": "Northern",
+    "NR": "Southern",
+    "NU": "Southern",
+    "NZ": "Southern",
+    "OM": "Northern",
+    "PA": "Northern",
+    "PE": "Southern",
+    "PF": "Southern",
+    "PG": "Southern",
+    "PH": "Northern",
+    "PK": "Northern",
+    "PL": "Northern",
+    "PM": "Northern",
+    "PN": "Southern",
+    "PR": "Northern",
+    "PS": "Northern",
+    "PT": "Northern",
+    "PW": "Northern",
+    "PY": "Southern",
+    "QA": "Northern",
+    "RE": "Southern",
+    "RO": "Northern",
+    "RS": "Northern",
+    "RU": "Northern",
+    "RW": "Southern",
+    "SA": "Northern",
+    "SB": "Southern",
+    "SC": "Southern",
+    "SD": "Northern",
+    "SE": "Northern",
+    "SG": "Northern",
+    "SH": "Southern",
+    "SI": "Northern",
+    "SJ": "Northern",
+    "SK": "Northern",
+    "SL": "Northern",
+    "SM": "Northern",
+    "SN": "Northern",
+    "SO": "Northern",
+    "SR": "Northern",
+    "SS": "Northern",
+    "ST": "Northern",
+    "SV": "Northern",
+    "SX": "Northern",
+    "SY": "Northern",
+    "SZ": "Southern",
+    "TC": "Northern",
+    "TD": "Northern",
+    "TF": "Southern",
+    "TG": "Northern",
+    "TH": "Northern",
+    "TJ": "Northern",
+    "TK": "Southern",
+    "TL": "Southern",
+    "TM": "Northern",
+    "TN": "Northern",
+    "TO": "Southern",
+    "TR": "Northern",
+    "TT": "Northern",
+    "TV": "Southern",
+    "TW": "Northern",
+    "TZ": "Southern",
+    "UA": "Northern",
+    "UG": "Northern",
+    "UM": "Northern",
+    "US": "Northern",
+    "UY": "Southern",
+    "UZ": "Northern",
+    "VA": "Northern",
+    "VC": "Northern",
+    "VE": "Northern",
+    "VG": "Northern",
+    "VI": "Northern",
+    "VN": "Northern",
+    "VU": "Southern",
+    "WF": "Southern",
+    "WS": "Southern",
+    "XK": "Northern",
+    "YE": "Northern",
+    "YT": "Southern",
+    "ZA": "Southern",
+    "ZM": "Southern",
+    "ZW": "Southern",
+}
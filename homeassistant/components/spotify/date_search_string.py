@@ -1,43 +1,63 @@
 """Contains HolidayDateMapper class, which provides functionality to map current holiday if there is one in the range of a week, otherwise to map current day, month and season to an appropriate search string to be entered in Spotify."""
 import calendar
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 import country_converter as coco
 from deep_translator import GoogleTranslator
-import geocoder
-import requests
 
 from homeassistant.core import HomeAssistant, State
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, NO_HOLIDAY
+from .const import COUNTRY_HEMISPHERE, DOMAIN, NO_HOLIDAY
+
+# Mapping containing the season on given hemisphere during certain months
+_SEASON_HEMISPHERE_MAPPING = {
+    1: {"Northern": "Winter", "Southern": "Summer"},
+    2: {"Northern": "Winter", "Southern": "Summer"},
+    3: {"Northern": "Spring", "Southern": "Autumn"},
+    4: {"Northern": "Spring", "Southern": "Autumn"},
+    5: {"Northern": "Spring", "Southern": "Autumn"},
+    6: {"Northern": "Summer", "Southern": "Winter"},
+    7: {"Northern": "Summer", "Southern": "Winter"},
+    8: {"Northern": "Summer", "Southern": "Winter"},
+    9: {"Northern": "Autumn", "Southern": "Spring"},
+    10: {"Northern": "Autumn", "Southern": "Spring"},
+    11: {"Northern": "Autumn", "Southern": "Spring"},
+    12: {"Northern": "Winter", "Southern": "Summer"},
+}
+
+# Flattened (month, hemisphere) -> season lookup used by get_season
+_SEASON_TABLE = {
+    (month, hemisphere): season
+    for month, hemispheres in _SEASON_HEMISPHERE_MAPPING.items()
+    for hemisphere, season in hemispheres.items()
+}
+
+
+@lru_cache(maxsize=256)
+def _country_code_to_iso2(country_code: str) -> str:
+    """Normalize a country code to ISO 3166-1 alpha-2, or "not found"."""
+    return coco.convert(country_code, to="ISO2")
 
 
 class HolidayDateMapper:
     """A class to find the current holiday and the season for a certain country and date. It uses these attributes to create a search string for spotify playlists."""
 
+    __slots__ = (
+        "hass",
+        "timeframe",
+        "time_unit",
+        "season_hemisphere_mapping",
+    )
+
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize of the HolidaySeasonMapper."""
         self.hass = hass
         self.update_values()
-
-        # Mapping containing the season on given hemisphere during certain months
-        self.season_hemisphere_mapping = {
-            1: {"Northern": "Winter", "Southern": "Summer"},
-            2: {"Northern": "Winter", "Southern": "Summer"},
-            3: {"Northern": "Spring", "Southern": "Autumn"},
-            4: {"Northern": "Spring", "Southern": "Autumn"},
-            5: {"Northern": "Spring", "Southern": "Autumn"},
-            6: {"Northern": "Summer", "Southern": "Winter"},
-            7: {"Northern": "Summer", "Southern": "Winter"},
-            8: {"Northern": "Summer", "Southern": "Winter"},
-            9: {"Northern": "Autumn", "Southern": "Spring"},
-            10: {"Northern": "Autumn", "Southern": "Spring"},
-            11: {"Northern": "Autumn", "Southern": "Spring"},
-            12: {"Northern": "Winter", "Southern": "Summer"},
-        }
+        self.season_hemisphere_mapping = _SEASON_HEMISPHERE_MAPPING
 
     def update_values(self):
         """Update timeframe values."""
@@ -50,55 +70,35 @@ class HolidayDateMapper:
         """Get the season in the given country on the given date."""
         month = current_date.month
 
-        # Convert the country code to the corresponding country name
-        country_name = coco.convert(country_code, to="name").lower()
-        if country_name == "not found":
+        # Normalize the country code to its ISO 3166-1 alpha-2 form
+        country_code_iso2 = _country_code_to_iso2(country_code)
+        if country_code_iso2 == "not found":
             raise AttributeError(
                 f"Country name not found for given country code {country_code}"
             )
 
         # Find the country zone which the country belongs to
         try:
-            location_zone = self.locate_country_zone(country_name)
+            location_zone = self.locate_country_zone(country_code_iso2)
 
         except ValueError as e:
             raise ValueError(f"Error in locating the country zone: {e}") from e
 
-        except ConnectionError as e:
-            raise ConnectionError(f"Connection error during geocoding: {e}") from e
-
-        # Get the corresponding seasons to the found country zone and month
-        hemispheres = self.season_hemisphere_mapping.get(month)
-        if not hemispheres:
-            raise ValueError(f"Provided {month} does not exist")
-
-        season = hemispheres.get(location_zone)
+        # Get the season for the found country zone and month
+        season = _SEASON_TABLE.get((month, location_zone))
         if not season:
             raise ValueError(f"No found season for location zone {location_zone}.")
 
         return season
 
-    def locate_country_zone(self, country_name: str) -> str:
+    def locate_country_zone(self, country_code: str) -> str:
         """Identify the hemisphere in which the country is located."""
-
-        # Get location information of the country given
         try:
-            location = geocoder.osm(country_name)
-        except requests.exceptions.RequestException as e:
-            raise ConnectionError(f"Connection error during geocoding: {e}") from e
-
-        # Extract the latitude from the location information of the country
-        latitude = location.latlng[0]
-
-        # Find the corresponding hemisphere from the latitudinal position
-        if 0 < latitude <= 90:
-            hemisphere = "Northern"
-        elif -90 <= latitude < 0:
-            hemisphere = "Southern"
-        else:
-            raise ValueError(f"No result found for the latitude {latitude}.")
-
-        return hemisphere
+            return COUNTRY_HEMISPHERE[country_code]
+        except KeyError as e:
+            raise ValueError(
+                f"No hemisphere found for the country code {country_code}."
+            ) from e
 
     def get_current_holiday(self, calendar_entity_ids: list[str], hass: HomeAssistant):
         """Check if current date is in holiday range, then return current holiday."""
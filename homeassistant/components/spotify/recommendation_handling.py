@@ -1,13 +1,15 @@
 """Provides handling for Spotify playlist recommendations in Home Assistant based on weather conditions and dates."""
+from concurrent.futures import Future
 from enum import Enum
 import logging
-from typing import Any, Optional
+import threading
+import time
+from typing import Any, NamedTuple, Optional
 
 from spotipy import Spotify, SpotifyException
 
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import entity_registry as er
 from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
@@ -17,9 +19,26 @@ from .weather_search_string import WeatherPlaylistMapper
 # Limit the number of items fetched from Spotify
 BROWSE_LIMIT = 48
 
+# Seconds a playlist search result is reused before Spotify is queried again
+PLAYLIST_CACHE_TTL = 3600
+
+# Seconds a failed search is not retried, when Spotify gives no Retry-After
+RATE_LIMIT_RETRY_DELAY = 30
+SERVER_ERROR_RETRY_DELAY = 10
+
+# Longest Retry-After honored, so a bad header cannot block searches for long
+MAX_RETRY_DELAY = 300
+
 _LOGGER = logging.getLogger(__name__)
 
 
+class PlaylistCacheKey(NamedTuple):
+    """Key of a playlist search in the recommendation caches."""
+
+    search_string: str
+    date: str
+
+
 class RecommendedPlaylistDomains(Enum):
     """Enum for integration domains used to recommended playlists."""
 
@@ -36,18 +55,33 @@ class RecommendationHandler:
 
     _instance: Optional["RecommendationHandler"] = None
 
-    # Variables for caching API call results and search strings
-    _last_weather_search_string: str = ""
-    _last_api_call_date: str = ""
-    _last_api_call_result_weather: list[Any] = []
-    _last_api_call_result_date: list[Any] = []
+    # Playlist search results keyed by (search string, date), each stored with
+    # the monotonic time it was fetched at
+    _playlist_cache: dict[
+        PlaylistCacheKey, tuple[float, Optional[dict[str, Any]], list[Any]]
+    ]
+
+    # Date search string and the date it was generated on, by (country, calendars)
+    _date_search_cache: dict[tuple[str | None, tuple[str, ...]], tuple[str, str]]
+
+    # Spotify errors keyed like the playlist cache, with the monotonic time
+    # until which the search is not retried
+    _error_cache: dict[PlaylistCacheKey, tuple[float, SpotifyException]]
 
-    _media: dict[str, Any] | None = None
+    # Spotify searches currently running in an executor thread, by cache key
+    _inflight: dict[PlaylistCacheKey, Future[dict[str, Any]]]
+    # Guards the searches in progress and updates of the caches
+    _inflight_lock: threading.Lock
 
     def __new__(cls) -> "RecommendationHandler":
         """Create a new instance of RecommendationHandler or return the existing instance."""
         if not cls._instance:
             cls._instance = super().__new__(cls)
+            cls._instance._playlist_cache = {}
+            cls._instance._date_search_cache = {}
+            cls._instance._error_cache = {}
+            cls._instance._inflight = {}
+            cls._instance._inflight_lock = threading.Lock()
         return cls._instance
 
     def handling_weather_recommendations(
@@ -100,32 +134,124 @@ class RecommendationHandler:
             _LOGGER.error(" Search_string value error: {e}")
         return current_weather_search_string
 
-    def _has_weather_changed(self, current_weather_search_string: str) -> bool:
-        """Check if the weather state has changed."""
-        if self._last_weather_search_string != current_weather_search_string:
-            return True
-        return False
+    def _cache_get(
+        self, key: PlaylistCacheKey
+    ) -> tuple[Optional[dict[str, Any]], list] | None:
+        """Return the cached playlists for the key, if they have not expired."""
+        if (cached := self._playlist_cache.get(key)) is None:
+            return None
+        fetched_at, media, items = cached
+        if time.monotonic() - fetched_at >= PLAYLIST_CACHE_TTL:
+            return None
+        return media, items
+
+    def _cache_put(
+        self, key: PlaylistCacheKey, media: Optional[dict[str, Any]], items: list
+    ) -> None:
+        """Cache the playlists for the key and drop expired playlists and errors."""
+        now = time.monotonic()
+        # Searches for other keys may be caching their playlists at the same time
+        with self._inflight_lock:
+            self._playlist_cache = {
+                cache_key: cached
+                for cache_key, cached in self._playlist_cache.items()
+                if now - cached[0] < PLAYLIST_CACHE_TTL
+            }
+            self._playlist_cache[key] = (now, media, items)
+            self._error_cache = {
+                cache_key: error
+                for cache_key, error in self._error_cache.items()
+                if now < error[0]
+            }
+
+    def _search_playlists(
+        self, spotify: Spotify, key: PlaylistCacheKey
+    ) -> dict[str, Any]:
+        """Search Spotify for the playlists of the key, sharing a search already in progress for it."""
+        with self._inflight_lock:
+            if (error := self._error_cache.get(key)) is not None:
+                retry_at, err = error
+                if time.monotonic() < retry_at:
+                    # Raise a new error, re-raising the cached one would keep
+                    # growing its traceback on every call
+                    raise SpotifyException(
+                        err.http_status,
+                        err.code,
+                        err.msg,
+                        reason=err.reason,
+                        headers=err.headers,
+                    ) from err
+                self._error_cache.pop(key, None)
+
+            if (future := self._inflight.get(key)) is not None:
+                waiting = True
+            else:
+                future = self._inflight[key] = Future()
+                waiting = False
+
+        if waiting:
+            return future.result()
+
+        try:
+            media = spotify.search(
+                q=key.search_string, type="playlist", limit=BROWSE_LIMIT
+            )
+        except Exception as err:
+            if isinstance(err, SpotifyException) and (
+                retry_delay := self._retry_delay(err)
+            ):
+                with self._inflight_lock:
+                    self._error_cache[key] = (time.monotonic() + retry_delay, err)
+            future.set_exception(err)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+        future.set_result(media)
+        return media
+
+    @staticmethod
+    def _retry_delay(err: SpotifyException) -> float | None:
+        """Return how long to wait before retrying a search that failed with the error, if at all."""
+        if err.http_status == 429:
+            try:
+                retry_after = float((err.headers or {})["Retry-After"])
+            except (KeyError, ValueError):
+                return RATE_LIMIT_RETRY_DELAY
+            # Negative and NaN values fail the comparison
+            if not retry_after >= 0:
+                return RATE_LIMIT_RETRY_DELAY
+            return min(retry_after, MAX_RETRY_DELAY)
+        if err.http_status is not None and err.http_status >= 500:
+            return SERVER_ERROR_RETRY_DELAY
+        return None
+
+    @staticmethod
+    def _extract_items(media: Optional[dict[str, Any]]) -> list[Any]:
+        """Return the playlist items of a Spotify search response, at most BROWSE_LIMIT."""
+        # Spotify may leave out or null the playlists and their items
+        playlists = (media or {}).get("playlists") or {}
+        return (playlists.get("items") or [])[:BROWSE_LIMIT]
 
     def _fetch_weather_spotify_playlist(
         self, spotify: Spotify, current_weather_search_string: str
     ) -> tuple[Optional[dict[str, Any]], list]:
-        """Fetch playlist from spotify based on the given search string if the weather state has changed."""
-        items = []
+        """Fetch playlist from spotify based on the given search string, unless it is cached."""
+        key = PlaylistCacheKey(
+            current_weather_search_string, dt_util.now().date().isoformat()
+        )
+        if (cached := self._cache_get(key)) is not None:
+            return cached
+
+        items: list[Any] = []
         media: dict[str, Any] | None = None
         try:
-            if self._has_weather_changed(current_weather_search_string):
-                if media := spotify.search(
-                    q=current_weather_search_string,
-                    type="playlist",
-                    limit=BROWSE_LIMIT,
-                ):
-                    items = media.get("playlists", {}).get("items", [])
-                    self._last_api_call_result_weather = items
-                    self._last_weather_search_string = current_weather_search_string
-                    self._media = media
-            else:
-                items = self._last_api_call_result_weather
-                media = self._media
+            media = self._search_playlists(spotify, key)
+            items = self._extract_items(media)
+            # Search again next time rather than keeping an empty result for the whole TTL
+            if items:
+                self._cache_put(key, media, items)
         except SpotifyException:
             # Handle Spotify API exceptions
             _LOGGER.error("Spotify API error: {e}")
@@ -140,13 +266,22 @@ class RecommendationHandler:
             current_date_search_string = self._generate_date_search_string(hass, user)
             current_date = dt_util.now().date().isoformat()
 
-            # Fetch playlists if the date has changed since the last API call or issue with previous API call
-            if self._is_new_date(hass, current_date):
-                hass.data[DOMAIN]["timeframe_updated"] = "FALSE"
-                return self._fetch_spotify_playlists(
-                    spotify, current_date_search_string, current_date
+            # Reuse the playlists for this search string today, unless the timeframe was changed
+            if (
+                hass.data[DOMAIN].get("timeframe_updated") != "TRUE"
+                and (
+                    cached := self._cache_get(
+                        PlaylistCacheKey(current_date_search_string, current_date)
+                    )
                 )
-            return self._media, self._last_api_call_result_date
+                is not None
+            ):
+                return cached
+
+            hass.data[DOMAIN]["timeframe_updated"] = "FALSE"
+            return self._fetch_spotify_playlists(
+                spotify, current_date_search_string, current_date
+            )
 
         except HomeAssistantError as e:
             _LOGGER.error("Home Assistant error: %s", e)
@@ -165,33 +300,36 @@ class RecommendationHandler:
         return None, []
 
     def _generate_date_search_string(self, hass: HomeAssistant, user: Any) -> str:
-        """Generate a search string based on the current date."""
+        """Generate a search string based on the current date, reusing the one generated earlier today."""
         calendar_entity_ids = self.get_entity_ids(
             hass, RecommendedPlaylistDomains.CALENDAR
         )
-
-        return HolidayDateMapper(hass).search_string_date(
-            calendar_entity_ids, hass, user
+        current_date = dt_util.now().date().isoformat()
+        key = (
+            user.get("country") if user else None,
+            tuple(calendar_entity_ids),
         )
 
-    def _is_new_date(self, hass: HomeAssistant, current_date: str) -> bool:
-        """Check if the current date is different from the last API call date or issue with previous API call."""
-        return (
-            dt_util.parse_date(self._last_api_call_date) is None
-            or self._last_api_call_date != current_date
-            or hass.data[DOMAIN].get("timeframe_updated") == "TRUE"
+        if (
+            hass.data[DOMAIN].get("timeframe_updated") != "TRUE"
+            and (cached := self._date_search_cache.get(key)) is not None
+            and cached[0] == current_date
+        ):
+            return cached[1]
+
+        search_string = HolidayDateMapper(hass).search_string_date(
+            calendar_entity_ids, hass, user
         )
+        self._date_search_cache[key] = (current_date, search_string)
+        return search_string
 
     def _fetch_spotify_playlists(
         self, spotify: Spotify, search_string: str, current_date: str
     ) -> tuple[Optional[dict[str, Any]], list]:
         """Fetch playlists from Spotify based on the given search string."""
-        media = spotify.search(q=search_string, type="playlist", limit=BROWSE_LIMIT)
-        items = media.get("playlists", {}).get("items", [])
-
-        # Limit the number of items to BROWSE_LIMIT
-        if len(items) > BROWSE_LIMIT:
-            items = items[:BROWSE_LIMIT]
+        key = PlaylistCacheKey(search_string, current_date)
+        media = self._search_playlists(spotify, key)
+        items = self._extract_items(media)
 
         if not items:
             _LOGGER.error(
@@ -201,10 +339,7 @@ class RecommendationHandler:
                 "There was an issue with fetching the playlists from spotify for current date. Please check back later."
             )
 
-        # Update cache with the latest API call results
-        self._last_api_call_result_date = items
-        self._last_api_call_date = current_date
-        self._media = media
+        self._cache_put(key, media, items)
 
         return media, items
 
@@ -212,10 +347,9 @@ class RecommendationHandler:
     def get_entity_ids(
         hass: HomeAssistant, domain: RecommendedPlaylistDomains
     ) -> list[str]:
-        """Retrieve entity id's for connected integrations in the given domain."""
-        entity_reg = er.async_get(hass)
-        return [
-            entity.entity_id
-            for entity in entity_reg.entities.values()
-            if entity.domain == domain.value
-        ]
+        """Retrieve entity id's for connected integrations in the given domain.
+
+        Must be called from an executor thread, the state machine's per-domain
+        index is read on the event loop.
+        """
+        return hass.states.entity_ids(domain.value)
@@ -1,12 +1,19 @@
 """Utils for Spotify."""
 from __future__ import annotations
 
+import re
 from typing import Any
 
 import yarl
 
 from .const import MEDIA_PLAYER_PREFIX
 
+# A media browser URL yarl would leave as is: a plain host and a single path
+# segment that is not a dot-segment
+_PLAIN_MEDIA_BROWSER_URL = re.compile(
+    rf"{re.escape(MEDIA_PLAYER_PREFIX)}[\w.-]+/(?!\.{{1,2}}$)([\w:.-]+)", re.ASCII
+)
+
 
 def is_spotify_media_type(media_content_type: str) -> bool:
     """Return whether the media_content_type is a valid Spotify media_id."""
@@ -20,15 +27,16 @@ def resolve_spotify_media_type(media_content_type: str) -> str:
 
 def fetch_image_url(item: dict[str, Any], key="images") -> str | None:
     """Fetch image url."""
-    try:
-        return item.get(key, [])[0].get("url")
-    except IndexError:
+    if not (images := item.get(key)):
         return None
+    return images[0].get("url")
 
 
 def spotify_uri_from_media_browser_url(media_content_id: str) -> str:
     """Extract spotify URI from media browser URL."""
     if media_content_id and media_content_id.startswith(MEDIA_PLAYER_PREFIX):
-        parsed_url = yarl.URL(media_content_id)
-        media_content_id = parsed_url.name
+        # Only parse the full URL when it is not of the plain <prefix><user>/<uri> shape
+        if match := _PLAIN_MEDIA_BROWSER_URL.fullmatch(media_content_id):
+            return match.group(1)
+        return yarl.URL(media_content_id).name
     return media_content_id
@@ -1,14 +1,41 @@
 """Contains the WeatherPlaylistMapper class, which provides functionality to map weather conditions and temperature ranges to an appropriate search string to be entered in Spotify."""
-import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from homeassistant.const import UnitOfTemperature
+from homeassistant.util.json import json_loads_object
+
+# Temperature categories indexed by whether the temperature reaches the threshold
+_TEMPERATURE_CATEGORIES = ("cold", "warm")
+
+# Separators after which a condition variant may append a qualifier
+_CONDITION_SEPARATORS = ("-", "_", " ")
+
+
+@lru_cache
+def _load_mapping(mapping_file: str) -> dict[str, Any]:
+    """Load and parse a mapping file once per process."""
+    mapping = json_loads_object(Path(mapping_file).read_bytes())
+    # Normalize the condition keys once so canonical conditions match directly
+    return {condition.strip().lower(): value for condition, value in mapping.items()}
 
 
 class WeatherPlaylistMapper:
     """A class to map weather conditions and temperatures to a matching search string for Spotify."""
 
+    __slots__ = ("spotify_category_mapping",)
+
     # Constant for the temperature threshold
     TEMPERATURE_THRESHOLD_CELSIUS = 15
     TEMPERATURE_THRESHOLD_FAHRENHEIT = 59
 
+    # Temperature threshold by unit, any other unit is treated as fahrenheit
+    TEMPERATURE_THRESHOLDS = {
+        "celsius": TEMPERATURE_THRESHOLD_CELSIUS,
+        UnitOfTemperature.CELSIUS: TEMPERATURE_THRESHOLD_CELSIUS,
+    }
+
     def __init__(
         self, mapping_file="homeassistant/components/spotify/spotify_mappings.json"
     ) -> None:
@@ -21,8 +48,7 @@ class WeatherPlaylistMapper:
             FileNotFoundError: If the mapping file is not found.
         """
         try:
-            with open(mapping_file, encoding="utf-8") as file:
-                self.spotify_category_mapping = json.load(file)
+            self.spotify_category_mapping = _load_mapping(mapping_file)
         except FileNotFoundError as e:
             raise FileNotFoundError(
                 f"The mapping file {mapping_file} was not found."
@@ -47,21 +73,23 @@ class WeatherPlaylistMapper:
                         given temperature category.
         """
 
-        # Normalize the condition to lower case for reliable matching
-        condition = condition.strip().lower()
-
-        temperature_threshold = (
-            self.TEMPERATURE_THRESHOLD_CELSIUS
-            if temperature_unit == "celsius"
-            else self.TEMPERATURE_THRESHOLD_FAHRENHEIT
+        temperature_threshold = self.TEMPERATURE_THRESHOLDS.get(
+            temperature_unit, self.TEMPERATURE_THRESHOLD_FAHRENHEIT
         )
 
-        temperature_category = "cold" if temperature < temperature_threshold else "warm"
+        temperature_category = _TEMPERATURE_CATEGORIES[
+            temperature >= temperature_threshold
+        ]
 
         # Retrieve the suitable Spotify category ID from the mapping
         # Handle cases where the condition is not in the mapping
         # FIX: Handle the ValueError in the code that calls this method,
         condition_mapping = self.spotify_category_mapping.get(condition)
+        if not condition_mapping:
+            # Normalize the condition to lower case for reliable matching, weather
+            # entities already report lower case conditions so this is rarely needed
+            condition = condition.strip().lower()
+            condition_mapping = self._match_condition(condition)
         if not condition_mapping:
             raise ValueError(f"Weather condition {condition} does not exist")
 
@@ -72,3 +100,20 @@ class WeatherPlaylistMapper:
             )
 
         return spotify_search_string
+
+    def _match_condition(self, condition: str) -> dict[str, str] | None:
+        """Find the mapping for the condition or its longest known prefix.
+
+        Weather providers report variants such as "partlycloudy-day", so only
+        prefixes ending right before a separator are considered.
+        """
+        while (
+            condition_mapping := self.spotify_category_mapping.get(condition)
+        ) is None:
+            separator_index = max(
+                condition.rfind(separator) for separator in _CONDITION_SEPARATORS
+            )
+            if separator_index <= 0:
+                return None
+            condition = condition[:separator_index]
+        return condition_mapping
@@ -19,15 +19,13 @@ class ThreadConfigFlow(ConfigFlow, domain=DOMAIN):
         self, import_data: dict[str, str] | None = None
     ) -> FlowResult:
         """Set up by import from async_setup."""
-        await self._async_handle_discovery_without_unique_id()
-        return self.async_create_entry(title="Thread", data={})
+        return await self._async_create_thread_entry()
 
     async def async_step_user(
         self, user_input: dict[str, str] | None = None
     ) -> FlowResult:
-        """Set up by import from async_setup."""
-        await self._async_handle_discovery_without_unique_id()
-        return self.async_create_entry(title="Thread", data={})
+        """Set up by the user."""
+        return await self._async_create_thread_entry()
 
     async def async_step_zeroconf(
         self, discovery_info: zeroconf.ZeroconfServiceInfo
@@ -44,9 +42,7 @@ class ThreadConfigFlow(ConfigFlow, domain=DOMAIN):
             return self.async_create_entry(title="Thread", data={})
         return self.async_show_form(step_id="confirm")
 
-    # async def async_import(self, data: dict[str, str] | None = None) -> FlowResult:
-    #    """Set up by import from async_setup.
-    #    Data represents either input from user or imported data, which should be given in the call of the method.
-    #    """
-    #    await self._async_handle_discovery_without_unique_id()
-    #    return self.async_create_entry(title="Thread", data={})
+    async def _async_create_thread_entry(self) -> FlowResult:
+        """Create the Thread config entry unless it is already configured."""
+        await self._async_handle_discovery_without_unique_id()
+        return self.async_create_entry(title="Thread", data={})
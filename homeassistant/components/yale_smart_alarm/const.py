@@ -29,6 +29,14 @@ COORDINATOR = "coordinator"
 
 DEFAULT_SCAN_INTERVAL = 15
 
+DEVICE_TYPE_DOOR_LOCK = "device_type.door_lock"
+DEVICE_TYPE_DOOR_CONTACT = "device_type.door_contact"
+
+DEVICE_STATUS_LOCK = "device_status.lock"
+DEVICE_STATUS_UNLOCK = "device_status.unlock"
+DEVICE_STATUS_CLOSE = "device_status.dc_close"
+DEVICE_STATUS_OPEN = "device_status.dc_open"
+
 LOGGER = logging.getLogger(__package__)
 
 ATTR_ONLINE = "online"
@@ -1,7 +1,9 @@
 """DataUpdateCoordinator for the Yale integration."""
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import timedelta
+from itertools import product
 from typing import Any
 
 from yalesmartalarmclient.client import YaleSmartAlarmClient
@@ -13,7 +15,51 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN, LOGGER, YALE_BASE_ERRORS
+from .const import (
+    DEFAULT_SCAN_INTERVAL,
+    DEVICE_STATUS_CLOSE,
+    DEVICE_STATUS_LOCK,
+    DEVICE_STATUS_OPEN,
+    DEVICE_STATUS_UNLOCK,
+    DEVICE_TYPE_DOOR_CONTACT,
+    DEVICE_TYPE_DOOR_LOCK,
+    DOMAIN,
+    LOGGER,
+    YALE_BASE_ERRORS,
+)
+
+# Lock (state, state2) keyed on (has lock status, closed, locked,
+# lock in status1, unlock in status1), missing keys mean unavailable
+_LOCK_STATE_TABLE: dict[tuple[bool, bool, bool, bool, bool], tuple[str, str | None]] = {
+    # Without a lock status only status1 is known
+    (False, False, False, True, False): ("locked", "unknown"),
+    (False, False, False, True, True): ("locked", "unknown"),
+    (False, False, False, False, True): ("unlocked", "unknown"),
+    **{
+        (True, closed, locked, lock_in_state, unlock_in_state): (
+            ("locked" if locked else "unlocked", "closed")
+            if closed
+            else ("unlocked", "open")
+        )
+        for closed, locked, lock_in_state, unlock_in_state in product(
+            (False, True), repeat=4
+        )
+        if lock_in_state or unlock_in_state
+    },
+}
+
+# Contact state indexed by (close in status1) << 1 | (open in status1)
+_CONTACT_STATES = ("unavailable", "open", "closed", "closed")
+
+
+@dataclass(slots=True)
+class YaleDevice:
+    """Processed state of a Yale lock or door contact."""
+
+    address: str
+    name: str
+    state: str
+    state2: str | None = None
 
 
 class YaleDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
@@ -36,29 +82,22 @@ class YaleDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         updates = await self.hass.async_add_executor_job(self.get_updates)
 
-        locks: list[dict[str, Any]] = []
-        door_windows: list[dict[str, Any]] = []
-
-        device_status_lock = "device_status.lock"
-        device_status_unlock = "device_status.unlock"
-        device_status_close = "device_status.dc_close"
-        device_status_open = "device_status.dc_open"
+        locks: list[YaleDevice] = []
+        door_windows: list[YaleDevice] = []
+        _sensor_map: dict[str, str] = {}
+        _lock_map: dict[str, str] = {}
 
         for device in updates["cycle"]["device_status"]:
+            device_type = device["type"]
             state = device["status1"]
-            if device["type"] == "device_type.door_lock":
-                self.process_door_lock(
-                    device, locks, device_status_lock, device_status_unlock, state
-                )
-            elif device["type"] == "device_type.door_contact":
-                self.process_door_contact(
-                    device, door_windows, device_status_close, device_status_open, state
-                )
-
-        _sensor_map = {
-            contact["address"]: contact["_state"] for contact in door_windows
-        }
-        _lock_map = {lock["address"]: lock["_state"] for lock in locks}
+            if device_type == DEVICE_TYPE_DOOR_LOCK:
+                lock = self.process_door_lock(device, state)
+                locks.append(lock)
+                _lock_map[lock.address] = lock.state
+            elif device_type == DEVICE_TYPE_DOOR_CONTACT:
+                contact = self.process_door_contact(device, state)
+                door_windows.append(contact)
+                _sensor_map[contact.address] = contact.state
 
         return {
             "alarm": updates["arm_status"],
@@ -74,76 +113,41 @@ class YaleDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def process_door_lock(
         self,
         device: dict[str, Any],
-        locks: list[dict[str, Any]],
-        device_status_lock: str,
-        device_status_unlock: str,
         state: str,
-    ) -> None:
+    ) -> YaleDevice:
         """Process the data for a door lock device."""
 
         lock_status_str = device["minigw_lock_status"]
-        lock_status = int(str(lock_status_str or 0), 16)
+        if lock_status_str and not isinstance(lock_status_str, str):
+            # Read any other payload type, like an int, as its string form
+            lock_status_str = str(lock_status_str)
+        lock_status = int(lock_status_str, 16) if lock_status_str else 0
         closed = (lock_status & 16) == 16
         locked = (lock_status & 1) == 1
 
-        if not lock_status and device_status_lock in state:
-            device["_state"] = "locked"
-            device["_state2"] = "unknown"
-
-        elif not lock_status and device_status_unlock in state:
-            device["_state"] = "unlocked"
-            device["_state2"] = "unknown"
-
-        elif (
-            lock_status
-            and (device_status_lock in state or device_status_unlock in state)
-            and closed
-            and locked
-        ):
-            device["_state"] = "locked"
-            device["_state2"] = "closed"
-
-        elif (
-            lock_status
-            and (device_status_lock in state or device_status_unlock in state)
-            and closed
-            and not locked
-        ):
-            device["_state"] = "unlocked"
-            device["_state2"] = "closed"
-
-        elif (
-            lock_status
-            and (device_status_lock in state or device_status_unlock in state)
-            and not closed
-        ):
-            device["_state"] = "unlocked"
-            device["_state2"] = "open"
-        else:
-            device["_state"] = "unavailable"
-
-        locks.append(device)
+        key = (
+            bool(lock_status),
+            closed,
+            locked,
+            DEVICE_STATUS_LOCK in state,
+            DEVICE_STATUS_UNLOCK in state,
+        )
+        lock_state, lock_state2 = _LOCK_STATE_TABLE.get(key, ("unavailable", None))
+
+        return YaleDevice(device["address"], device["name"], lock_state, lock_state2)
 
     def process_door_contact(
         self,
         device: dict[str, Any],
-        door_windows: list[dict[str, Any]],
-        device_status_close: str,
-        device_status_open: str,
         state: str,
-    ) -> None:
+    ) -> YaleDevice:
         """Process the data for a door contact device."""
 
-        if device_status_close in state:
-            device["_state"] = "closed"
-
-        elif device_status_open in state:
-            device["_state"] = "open"
-
-        else:
-            device["_state"] = "unavailable"
+        contact_state = _CONTACT_STATES[
+            (DEVICE_STATUS_CLOSE in state) << 1 | (DEVICE_STATUS_OPEN in state)
+        ]
 
-        door_windows.append(device)
+        return YaleDevice(device["address"], device["name"], contact_state)
 
     def get_updates(self) -> dict[str, Any]:
         """Fetch data from Yale."""
@@ -159,8 +163,9 @@ class YaleDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 raise UpdateFailed from error
 
         try:
-            arm_status = self.yale.get_armed_status()
             data = self.yale.get_all()
+            # get_all already includes the mode, avoid fetching it separately
+            arm_status = data["MODE"][0].get("mode")
             cycle = data["CYCLE"]
             status = data["STATUS"]
             online = data["ONLINE"]
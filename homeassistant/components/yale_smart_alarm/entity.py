@@ -6,7 +6,7 @@ from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, MANUFACTURER, MODEL
-from .coordinator import YaleDataUpdateCoordinator
+from .coordinator import YaleDataUpdateCoordinator, YaleDevice
 
 
 class YaleEntity(CoordinatorEntity[YaleDataUpdateCoordinator], Entity):
@@ -14,15 +14,17 @@ class YaleEntity(CoordinatorEntity[YaleDataUpdateCoordinator], Entity):
 
     _attr_has_entity_name = True
 
-    def __init__(self, coordinator: YaleDataUpdateCoordinator, data: dict) -> None:
+    def __init__(
+        self, coordinator: YaleDataUpdateCoordinator, data: YaleDevice
+    ) -> None:
         """Initialize an Yale device."""
         super().__init__(coordinator)
-        self._attr_unique_id: str = data["address"]
+        self._attr_unique_id: str = data.address
         self._attr_device_info: DeviceInfo = DeviceInfo(
-            name=data["name"],
+            name=data.name,
             manufacturer=MANUFACTURER,
             model=MODEL,
-            identifiers={(DOMAIN, data["address"])},
+            identifiers={(DOMAIN, data.address)},
             via_device=(DOMAIN, self.coordinator.entry.data[CONF_USERNAME]),
         )
 
@@ -17,7 +17,7 @@ from .const import (
     DOMAIN,
     YALE_ALL_ERRORS,
 )
-from .coordinator import YaleDataUpdateCoordinator
+from .coordinator import YaleDataUpdateCoordinator, YaleDevice
 from .entity import YaleEntity
 
 
@@ -43,12 +43,15 @@ class YaleDoorlock(YaleEntity, LockEntity):
     _attr_name = None
 
     def __init__(
-        self, coordinator: YaleDataUpdateCoordinator, data: dict, code_format: int
+        self,
+        coordinator: YaleDataUpdateCoordinator,
+        data: YaleDevice,
+        code_format: int,
     ) -> None:
         """Initialize the Yale Lock Device."""
         super().__init__(coordinator, data)
         self._attr_code_format = rf"^\d{{{code_format}}}$"
-        self.lock_name: str = data["name"]
+        self.lock_name: str = data.name
 
     async def async_unlock(self, **kwargs: Any) -> None:
         """Send unlock command."""
@@ -1 +1,3 @@
 """Tests for the Spotify integration."""
+
+MAPPING_FILE = "homeassistant/components/spotify/spotify_mappings.json"
@@ -0,0 +1,46 @@
+"""Common fixtures for the Spotify tests."""
+from unittest.mock import MagicMock
+
+import pytest
+from spotipy import Spotify
+
+from homeassistant.components.spotify.recommendation_handling import (
+    RecommendationHandler,
+)
+from homeassistant.components.spotify.weather_search_string import WeatherPlaylistMapper
+
+from . import MAPPING_FILE
+
+
+@pytest.fixture(autouse=True)
+def reset_recommendation_handler() -> None:
+    """Start every test with a new RecommendationHandler and empty caches."""
+    RecommendationHandler._instance = None
+
+
+@pytest.fixture
+def handler() -> RecommendationHandler:
+    """Return the RecommendationHandler used by the integration."""
+    return RecommendationHandler()
+
+
+@pytest.fixture
+def spotify_mock() -> MagicMock:
+    """Mock the Spotify client used by the integration."""
+    return MagicMock(spec=Spotify)
+
+
+@pytest.fixture
+def mock_date_search_string(handler: RecommendationHandler) -> MagicMock:
+    """Mock the date search string used for date playlist recommendations."""
+    mock = MagicMock(return_value="Test Playlist")
+    # The handler is discarded after every test, so no need to restore it
+    handler._generate_date_search_string = mock  # type: ignore[method-assign]
+    return mock
+
+
+# The mapper is only read by the tests, so all of them can share it
+@pytest.fixture(scope="session")
+def mapper() -> WeatherPlaylistMapper:
+    """Fixture for initializing the WeatherPlaylistMapper with the integration mappings."""
+    return WeatherPlaylistMapper(MAPPING_FILE)
@@ -1,12 +1,17 @@
 """Module for testing the HolidayDateMapper functionality in the Spotify integration."""
 import datetime as dt
 from datetime import datetime, timedelta
+import re
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from homeassistant.components.spotify.const import NO_HOLIDAY
-from homeassistant.components.spotify.date_search_string import HolidayDateMapper
+from homeassistant.components.spotify.date_search_string import (
+    HolidayDateMapper,
+    _country_code_to_iso2,
+)
 from homeassistant.components.spotify.recommendation_handling import (
     RecommendationHandler,
     RecommendedPlaylistDomains,
@@ -16,88 +21,137 @@ from homeassistant.exceptions import HomeAssistantError
 
 A_HOLIDAY_TITLE = "a holiday title"
 ANOTHER_HOLIDAY_TITLE = "another holiday title"
+HOLIDAY_DATES_ERROR = re.compile(
+    "Problem with fetching holiday dates for holiday: some holiday"
+)
 
 
-@pytest.fixture
-def holiday_date_mapper():
-    """Fixture for initializing the HolidayDateMapper."""
+def make_holiday_state(start_time: str, message: str, end_time: str) -> SimpleNamespace:
+    """Create a stand-in calendar state, the mapper only reads as_compressed_state."""
+    return SimpleNamespace(
+        as_compressed_state={
+            "a": {"start_time": start_time, "message": message, "end_time": end_time}
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def shared_holiday_date_mapper() -> HolidayDateMapper:
+    """Fixture for initializing the HolidayDateMapper once per session."""
     return HolidayDateMapper(hass=MagicMock())
 
 
+@pytest.fixture
+def holiday_date_mapper(
+    shared_holiday_date_mapper: HolidayDateMapper,
+) -> HolidayDateMapper:
+    """Fixture for the shared HolidayDateMapper, with the timeframe reset per test."""
+    shared_holiday_date_mapper.update_values()
+    return shared_holiday_date_mapper
+
+
+@pytest.fixture(scope="module")
+def calendar_state() -> State:
+    """Fixture for a calendar state, which the date mapper never modifies."""
+    return State("calendar.some_calendar", "state")
+
+
+@pytest.fixture
+def mock_translate(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Mock the Google translation of calendar names."""
+    mock = MagicMock()
+    monkeypatch.setattr(
+        "homeassistant.components.spotify.date_search_string.GoogleTranslator.translate",
+        mock,
+    )
+    return mock
+
+
+@pytest.fixture
+def mock_today(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Mock the current time used by the date mapper."""
+    mock = MagicMock()
+    monkeypatch.setattr(
+        "homeassistant.components.spotify.date_search_string.dt_util.now", mock
+    )
+    return mock
+
+
 def test_init_valid_date_mapper(holiday_date_mapper: HolidayDateMapper) -> None:
     """Test initialization of HolidayDateMapper."""
     assert holiday_date_mapper.season_hemisphere_mapping is not None
     assert holiday_date_mapper.timeframe is not None
 
 
-@patch("homeassistant.components.spotify.date_search_string.geocoder.osm")
-def test_get_hemisphere(
-    mock_geocoder_osm,
-    holiday_date_mapper: HolidayDateMapper,
-) -> None:
-    """Test get accurate hemisphare based on latitude provided from mocking."""
-
-    mock_location = mock_geocoder_osm.return_value
-    mock_location.ok = True
-    mock_location.latlng = (59.33258, 18.0649)
-
-    hemisphere = holiday_date_mapper.locate_country_zone("Sweden")
+def test_get_hemisphere(holiday_date_mapper: HolidayDateMapper) -> None:
+    """Test get accurate hemisphere based on the country code."""
+    assert holiday_date_mapper.locate_country_zone("SE") == "Northern"
+    assert holiday_date_mapper.locate_country_zone("AU") == "Southern"
 
-    assert hemisphere == "Northern"
 
-
-@patch("homeassistant.components.spotify.date_search_string.geocoder.osm")
-def test_get_season(mock_geocoder_osm, holiday_date_mapper: HolidayDateMapper) -> None:
+def test_get_season(holiday_date_mapper: HolidayDateMapper) -> None:
     """Test get correct season from given country and date."""
-    mock_location = mock_geocoder_osm.return_value
-    mock_location.ok = True
-    mock_location.latlng = (-35.28346, 149.12807)
-
     date = dt.date(year=2023, month=11, day=17)
     season = holiday_date_mapper.get_season("AU", date)
 
     assert season == "Spring"
 
+    season = holiday_date_mapper.get_season("SE", date)
+
+    assert season == "Autumn"
+
     with pytest.raises(
         AttributeError, match="Country name not found for given country code  "
     ):
         holiday_date_mapper.get_season(" ", date)
 
 
-@patch("homeassistant.components.spotify.date_search_string.geocoder.osm")
-def test_invalid_latitude_input(
-    mock_geocoder_osm, holiday_date_mapper: HolidayDateMapper
+def test_country_code_conversion_cached(
+    holiday_date_mapper: HolidayDateMapper,
 ) -> None:
-    """Test that a ValueError is raised when an incorrect latitude is provided."""
-    mock_location = mock_geocoder_osm.return_value
-    mock_location.ok = True
-    mock_location.latlng = (120, 149.12807)
+    """Test that the country code is only converted once per country."""
+    _country_code_to_iso2.cache_clear()
+    date = dt.date(year=2023, month=11, day=17)
+
+    with patch(
+        "homeassistant.components.spotify.date_search_string.coco.convert",
+        return_value="SE",
+    ) as mock_convert:
+        holiday_date_mapper.get_season("SE", date)
+        holiday_date_mapper.get_season("SE", date)
+
+    mock_convert.assert_called_once_with("SE", to="ISO2")
+    _country_code_to_iso2.cache_clear()
+
 
+def test_unknown_country_code(holiday_date_mapper: HolidayDateMapper) -> None:
+    """Test that a ValueError is raised when an unknown country code is provided."""
     with pytest.raises(
         ValueError,
-        match="No result found for the latitude 120.",
+        match="No hemisphere found for the country code XX.",
     ):
-        holiday_date_mapper.locate_country_zone("Australia")
-
-
-def test_get_month(holiday_date_mapper: HolidayDateMapper) -> None:
+        holiday_date_mapper.locate_country_zone("XX")
+
+
+@pytest.mark.parametrize(
+    ("date", "expected"),
+    [
+        (dt.date(year=2018, month=1, day=12), "January"),
+        (dt.date(year=2021, month=4, day=28), "April"),
+        (dt.date(year=2022, month=8, day=28), "August"),
+        (dt.date(year=2021, month=10, day=28), "October"),
+        (dt.date(year=2013, month=12, day=30), "December"),
+    ],
+)
+def test_get_month(
+    holiday_date_mapper: HolidayDateMapper, date: dt.date, expected: str
+) -> None:
     """Test correct month name is found."""
-    # testing some random dates
-    month_name = holiday_date_mapper.get_month(dt.date(year=2018, month=1, day=12))
-    assert month_name == "January"
+    assert holiday_date_mapper.get_month(date) == expected
 
-    month_name = holiday_date_mapper.get_month(dt.date(year=2021, month=4, day=28))
-    assert month_name == "April"
-
-    month_name = holiday_date_mapper.get_month(dt.date(year=2022, month=8, day=28))
-    assert month_name == "August"
-
-    month_name = holiday_date_mapper.get_month(dt.date(year=2021, month=10, day=28))
-    assert month_name == "October"
-
-    month_name = holiday_date_mapper.get_month(dt.date(year=2013, month=12, day=30))
-    assert month_name == "December"
 
+def test_get_month_invalid(holiday_date_mapper: HolidayDateMapper) -> None:
+    """Test that an invalid month cannot be looked up."""
     with pytest.raises(
         ValueError,
         match=("month must be in 1..12"),
@@ -105,34 +159,35 @@ def test_get_month(holiday_date_mapper: HolidayDateMapper) -> None:
         holiday_date_mapper.get_month(dt.date(year=2013, month=13, day=30))
 
 
-def test_get_day_of_week(holiday_date_mapper: HolidayDateMapper) -> None:
+@pytest.mark.parametrize(
+    ("date", "expected"),
+    [
+        (dt.date(year=2020, month=2, day=11), "Tuesday"),
+        (dt.date(year=2023, month=11, day=29), "Wednesday"),
+        (dt.date(year=2013, month=8, day=31), "Saturday"),
+    ],
+)
+def test_get_day_of_week(
+    holiday_date_mapper: HolidayDateMapper, date: dt.date, expected: str
+) -> None:
     """Test correct weekday name is found."""
-    # testing some random dates
-    weekday = holiday_date_mapper.get_day_of_week(dt.date(year=2020, month=2, day=11))
-    assert weekday == "Tuesday"
+    assert holiday_date_mapper.get_day_of_week(date) == expected
 
-    weekday = holiday_date_mapper.get_day_of_week(dt.date(year=2023, month=11, day=29))
-    assert weekday == "Wednesday"
 
-    weekday = holiday_date_mapper.get_day_of_week(dt.date(year=2013, month=8, day=31))
-    assert weekday == "Saturday"
-
-
-def test_no_google_calendar_setup(
+async def test_no_google_calendar_setup(
     hass: HomeAssistant, holiday_date_mapper: HolidayDateMapper
 ) -> None:
     """Test that no holiday is returned when no google calendar is set up when fetching holidays."""
-    calendar_entity_ids = RecommendationHandler.get_entity_ids(
-        hass, RecommendedPlaylistDomains.CALENDAR
+    calendar_entity_ids = await hass.async_add_executor_job(
+        RecommendationHandler.get_entity_ids, hass, RecommendedPlaylistDomains.CALENDAR
     )
     result = holiday_date_mapper.get_current_holiday(calendar_entity_ids, hass)
 
     assert result == NO_HOLIDAY
 
 
-@patch("homeassistant.components.spotify.date_search_string.GoogleTranslator.translate")
 def test_no_holiday_calendar(
-    mock_translate,
+    mock_translate: MagicMock,
     hass: HomeAssistant,
     holiday_date_mapper: HolidayDateMapper,
 ) -> None:
@@ -145,9 +200,8 @@ def test_no_holiday_calendar(
     assert result == NO_HOLIDAY
 
 
-@patch("homeassistant.components.spotify.date_search_string.GoogleTranslator.translate")
 def test_is_holiday_calendar(
-    mock_translate, holiday_date_mapper: HolidayDateMapper
+    mock_translate: MagicMock, holiday_date_mapper: HolidayDateMapper
 ) -> None:
     """Test that calendars including holidays are detected as holiday calendars."""
     mock_translate.return_value = "week numbers"
@@ -167,14 +221,15 @@ def test_is_holiday_in_range_no_state(holiday_date_mapper: HolidayDateMapper) ->
     assert result is False
 
 
-def test_is_holiday_in_range_no_date(holiday_date_mapper: HolidayDateMapper) -> None:
+def test_is_holiday_in_range_no_date(
+    holiday_date_mapper: HolidayDateMapper, calendar_state: State
+) -> None:
     """Test that a HomeAssistantError is raised when dates for the holiday is not given."""
     holiday_title = "some holiday"
-    calendar_state = State("calendar.some_calendar", "state")
 
     with pytest.raises(
         HomeAssistantError,
-        match=(f"Problem with fetching holiday dates for holiday: {holiday_title}"),
+        match=HOLIDAY_DATES_ERROR,
     ):
         holiday_date_mapper.is_holiday_in_range(
             calendar_state, None, None, holiday_title
@@ -182,7 +237,7 @@ def test_is_holiday_in_range_no_date(holiday_date_mapper: HolidayDateMapper) ->
 
     with pytest.raises(
         HomeAssistantError,
-        match=(f"Problem with fetching holiday dates for holiday: {holiday_title}"),
+        match=HOLIDAY_DATES_ERROR,
     ):
         holiday_date_mapper.is_holiday_in_range(
             calendar_state, "2023-11-28", None, holiday_title
@@ -190,16 +245,17 @@ def test_is_holiday_in_range_no_date(holiday_date_mapper: HolidayDateMapper) ->
 
     with pytest.raises(
         HomeAssistantError,
-        match=(f"Problem with fetching holiday dates for holiday: {holiday_title}"),
+        match=HOLIDAY_DATES_ERROR,
     ):
         holiday_date_mapper.is_holiday_in_range(
             calendar_state, None, "2023-11-28", holiday_title
         )
 
 
-@patch("homeassistant.components.spotify.date_search_string.dt_util.now")
 def test_is_holiday_in_range(
-    mock_today, holiday_date_mapper: HolidayDateMapper
+    mock_today: MagicMock,
+    holiday_date_mapper: HolidayDateMapper,
+    calendar_state: State,
 ) -> None:
     """Test if holiday is in weekly range."""
     # set today to 28 nov
@@ -208,7 +264,6 @@ def test_is_holiday_in_range(
     holiday_date_mapper.timeframe = 7
 
     holiday_title = "some holiday"
-    calendar_state = State("calendar.some_calendar", "state")
 
     # if the holiday is today
     holiday_date = dt.date(year=2023, month=11, day=28)
@@ -235,11 +290,9 @@ def test_is_holiday_in_range(
     assert result is False
 
 
-@patch("homeassistant.components.spotify.date_search_string.dt_util.now")
-@patch("homeassistant.components.spotify.date_search_string.GoogleTranslator.translate")
 def test_get_current_holiday(
-    mock_translate,
-    mock_today,
+    mock_translate: MagicMock,
+    mock_today: MagicMock,
     holiday_date_mapper: HolidayDateMapper,
 ) -> None:
     """Test that a holiday title is returned if there is an upcoming holiday."""
@@ -249,29 +302,21 @@ def test_get_current_holiday(
 
     holiday_date_mapper.timeframe = 7
 
-    mock_hass = MagicMock()
-    calendar_holiday_state = MagicMock()
+    calendar_holiday_state = make_holiday_state(
+        "2023-11-10 00:00:00", A_HOLIDAY_TITLE, "2023-11-10 00:00:00"
+    )
+    stub_hass = SimpleNamespace(
+        states=SimpleNamespace(get=lambda entity_id: calendar_holiday_state)
+    )
 
-    calendar_holiday_state.as_compressed_state = {
-        "a": {
-            "start_time": "2023-11-10 00:00:00",
-            "message": A_HOLIDAY_TITLE,
-            "end_time": "2023-11-10 00:00:00",
-        }
-    }
+    result = holiday_date_mapper.get_current_holiday(calendar_entity_ids, stub_hass)
 
-    with patch.object(mock_hass.states, "get") as mock_states_get:
-        mock_states_get.return_value = calendar_holiday_state
-        result = holiday_date_mapper.get_current_holiday(calendar_entity_ids, mock_hass)
-
-        assert result == A_HOLIDAY_TITLE
+    assert result == A_HOLIDAY_TITLE
 
 
-@patch("homeassistant.components.spotify.date_search_string.dt_util.now")
-@patch("homeassistant.components.spotify.date_search_string.GoogleTranslator.translate")
 def test_get_next_holiday(
-    mock_translate,
-    mock_today,
+    mock_translate: MagicMock,
+    mock_today: MagicMock,
     holiday_date_mapper: HolidayDateMapper,
 ) -> None:
     """Test that the next holiday title is returned."""
@@ -285,104 +330,81 @@ def test_get_next_holiday(
 
     holiday_date_mapper.timeframe = 7
 
-    # mock two holidays
-    mock_calendar_holiday_state_1 = MagicMock()
-    mock_calendar_holiday_state_1.as_compressed_state = {
-        "a": {
-            "start_time": "2023-11-10 00:00:00",
-            "message": A_HOLIDAY_TITLE,
-            "end_time": "2023-11-10 00:00:00",
-        }
-    }
-
-    mock_calendar_holiday_state_2 = MagicMock()
-    mock_calendar_holiday_state_2.as_compressed_state = {
-        "a": {
-            "start_time": "2023-12-25 00:00:00",
-            "message": ANOTHER_HOLIDAY_TITLE,
-            "end_time": "2023-12-25 23:59:59",
-        }
-    }
-
     mock_today.return_value = datetime(2023, 11, 9, 12, 0, 0)
 
     with patch.object(mock_hass.states, "get") as mock_states_get:
+        # mock two holidays
         mock_states_get.side_effect = [
-            mock_calendar_holiday_state_1,
-            mock_calendar_holiday_state_2,
+            make_holiday_state(
+                "2023-11-10 00:00:00", A_HOLIDAY_TITLE, "2023-11-10 00:00:00"
+            ),
+            make_holiday_state(
+                "2023-12-25 00:00:00", ANOTHER_HOLIDAY_TITLE, "2023-12-25 23:59:59"
+            ),
         ]
         result = holiday_date_mapper.get_current_holiday(calendar_entity_ids, mock_hass)
 
         assert result == A_HOLIDAY_TITLE
 
         # change which holiday comes first
-        mock_calendar_holiday_state_1.as_compressed_state = {
-            "a": {
-                "start_time": "2023-11-30 00:00:00",
-                "message": A_HOLIDAY_TITLE,
-                "end_time": "2023-11-30 00:00:00",
-            }
-        }
-        mock_calendar_holiday_state_2.as_compressed_state = {
-            "a": {
-                "start_time": "2023-11-11 00:00:00",
-                "message": ANOTHER_HOLIDAY_TITLE,
-                "end_time": "2023-11-11 23:59:59",
-            }
-        }
-
         mock_states_get.side_effect = [
-            mock_calendar_holiday_state_1,
-            mock_calendar_holiday_state_2,
+            make_holiday_state(
+                "2023-11-30 00:00:00", A_HOLIDAY_TITLE, "2023-11-30 00:00:00"
+            ),
+            make_holiday_state(
+                "2023-11-11 00:00:00", ANOTHER_HOLIDAY_TITLE, "2023-11-11 23:59:59"
+            ),
         ]
         result = holiday_date_mapper.get_current_holiday(calendar_entity_ids, mock_hass)
 
         assert result == ANOTHER_HOLIDAY_TITLE
 
 
-@patch(
-    "homeassistant.components.spotify.date_search_string.HolidayDateMapper.get_current_holiday"
-)
-@patch(
-    "homeassistant.components.spotify.date_search_string.HolidayDateMapper.get_season"
-)
-@patch(
-    "homeassistant.components.spotify.date_search_string.HolidayDateMapper.get_month"
-)
-@patch(
-    "homeassistant.components.spotify.date_search_string.HolidayDateMapper.get_day_of_week"
+@pytest.mark.parametrize(
+    ("holiday", "season", "month", "weekday", "expected"),
+    [
+        ("Christmas Eve", "Winter", "December", "Sunday", "Christmas Eve"),
+        (NO_HOLIDAY, "Summer", "July", "Friday", "Summer July Friday"),
+    ],
 )
 def test_search_string_date(
-    mock_weekday,
-    mock_month,
-    mock_season,
-    mock_holiday,
+    monkeypatch: pytest.MonkeyPatch,
     hass: HomeAssistant,
     holiday_date_mapper: HolidayDateMapper,
+    holiday: str,
+    season: str,
+    month: str,
+    weekday: str,
+    expected: str,
 ) -> None:
     """Test generated search string."""
-    mock_holiday.return_value = "Christmas Eve"
-    mock_season.return_value = "Winter"
-    mock_month.return_value = "December"
-    mock_weekday.return_value = "Sunday"
+    monkeypatch.setattr(
+        HolidayDateMapper, "get_current_holiday", lambda self, ids, hass: holiday
+    )
+    monkeypatch.setattr(
+        HolidayDateMapper, "get_season", lambda self, country, date: season
+    )
+    monkeypatch.setattr(HolidayDateMapper, "get_month", lambda self, date: month)
+    monkeypatch.setattr(
+        HolidayDateMapper, "get_day_of_week", lambda self, date: weekday
+    )
 
     user = {"country": "a country"}
     calendar_entity_ids = ["calendar.a_calendar"]
 
     result = holiday_date_mapper.search_string_date(calendar_entity_ids, hass, user)
 
-    assert result == "Christmas Eve"
-
-    mock_holiday.return_value = "No holiday"
-    mock_season.return_value = "Summer"
-    mock_month.return_value = "July"
-    mock_weekday.return_value = "Friday"
+    assert result == expected
 
-    user = {"country": "a country"}
-
-    result = holiday_date_mapper.search_string_date(calendar_entity_ids, hass, user)
 
-    assert result == "Summer July Friday"
+@patch.object(HolidayDateMapper, "get_current_holiday", return_value=NO_HOLIDAY)
+def test_search_string_date_invalid_user(
+    mock_holiday: MagicMock,
+    hass: HomeAssistant,
+    holiday_date_mapper: HolidayDateMapper,
+) -> None:
+    """Test that a search string is not generated without a user country."""
+    calendar_entity_ids = ["calendar.a_calendar"]
 
     with pytest.raises(ValueError, match="No user provided"):
         holiday_date_mapper.search_string_date(calendar_entity_ids, hass, None)
@@ -409,9 +431,8 @@ def test_search_string_date_no_calendar_configured(
         holiday_date_mapper.search_string_date(calendar_entity_ids, hass, user)
 
 
-@patch("homeassistant.components.spotify.date_search_string.dt_util.now")
 def test_timeframe_attribute(
-    mock_today, holiday_date_mapper: HolidayDateMapper
+    mock_today: MagicMock, holiday_date_mapper: HolidayDateMapper
 ) -> None:
     """Test the timeframe attribute."""
     holiday_date_mapper.timeframe = 7
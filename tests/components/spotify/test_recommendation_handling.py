@@ -1,53 +1,56 @@
 """Test Spotify Recommendation Handler."""
 
+from collections.abc import Generator
+from concurrent.futures import Future
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import DEFAULT, MagicMock, call, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 from spotipy.exceptions import SpotifyException
 
 from homeassistant.components.spotify.const import DOMAIN, NO_HOLIDAY
+from homeassistant.components.spotify.date_search_string import HolidayDateMapper
 from homeassistant.components.spotify.recommendation_handling import (
     BROWSE_LIMIT,
+    MAX_RETRY_DELAY,
+    PLAYLIST_CACHE_TTL,
+    RATE_LIMIT_RETRY_DELAY,
+    SERVER_ERROR_RETRY_DELAY,
+    PlaylistCacheKey,
     RecommendationHandler,
     RecommendedPlaylistDomains,
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.util import dt as dt_util
 
-from tests.components.accuweather import init_integration
+SUNNY_PLAYLISTS_RESPONSE = {
+    "playlists": {
+        "items": [
+            {"name": "Sunny Day Playlist 1", "id": "playlist_id_1"},
+            {"name": "Sunny Day Playlist 2", "id": "playlist_id_2"},
+        ]
+    }
+}
+TEST_PLAYLIST_RESPONSE = {"playlists": {"items": [{"name": "Test Playlist"}]}}
+EMPTY_RESPONSE: dict[str, Any] = {"playlists": {"items": []}}
+EXCESS_RESPONSE = {
+    "playlists": {"items": [{"name": f"Playlist {i}"} for i in range(100)]}
+}
+API_ERROR = SpotifyException(http_status=500, code=-1, msg="API Error")
+RATE_LIMIT_ERROR = SpotifyException(http_status=429, code=-1, msg="Rate Limit Exceeded")
 
-SPOTIFY_MOCK_PATH = "homeassistant.components.spotify.config_flow.Spotify"
 
-
-@patch(
-    "homeassistant.components.spotify.recommendation_handling.RecommendationHandler._has_weather_changed"
-)
 async def test_handling_weather_recommendations(
-    mock_has_weather_changed, hass: HomeAssistant
+    hass: HomeAssistant, spotify_mock: MagicMock, handler: RecommendationHandler
 ) -> None:
     """Test handling weather recommendations."""
-    handler = RecommendationHandler()
-    await init_integration(hass)
-
-    mock_has_weather_changed.return_value = True
-
-    with patch(SPOTIFY_MOCK_PATH) as spotify_mock, patch(
-        SPOTIFY_MOCK_PATH
-    ) as spotify_mock, patch.object(
+    with patch.object(
         handler,
         "_get_current_weather_search_string",
         return_value="Cold Sunny",
     ):
-        spotify_mock.search.return_value = {
-            "playlists": {
-                "items": [
-                    {"name": "Sunny Day Playlist 1", "id": "playlist_id_1"},
-                    {"name": "Sunny Day Playlist 2", "id": "playlist_id_2"},
-                ]
-            }
-        }
+        spotify_mock.search.return_value = SUNNY_PLAYLISTS_RESPONSE
 
         media, items = handler.handling_weather_recommendations(hass, spotify_mock)
 
@@ -57,436 +60,490 @@ async def test_handling_weather_recommendations(
         assert len(items) == 2
 
 
-async def test_no_weather_available(hass: HomeAssistant) -> None:
+@pytest.mark.parametrize(
+    "response",
+    [EMPTY_RESPONSE, {"playlists": {}}, {"playlists": None}, None],
+)
+async def test_handling_weather_recommendations_no_playlists(
+    hass: HomeAssistant,
+    spotify_mock: MagicMock,
+    handler: RecommendationHandler,
+    response: dict[str, Any] | None,
+) -> None:
+    """Test that weather recommendations without playlists are not cached."""
+    spotify_mock.search.return_value = response
+
+    with patch.object(
+        handler,
+        "_get_current_weather_search_string",
+        return_value="Cold Sunny",
+    ):
+        _, items = handler.handling_weather_recommendations(hass, spotify_mock)
+        assert items == []
+
+        handler.handling_weather_recommendations(hass, spotify_mock)
+
+    assert spotify_mock.search.call_count == 2
+
+
+async def test_no_weather_available(
+    hass: HomeAssistant, spotify_mock: MagicMock, handler: RecommendationHandler
+) -> None:
     """Test handling no setup weather integration."""
-    handler = RecommendationHandler()
+    spotify_mock.search.return_value = SUNNY_PLAYLISTS_RESPONSE
+
+    with pytest.raises(HomeAssistantError):
+        await hass.async_add_executor_job(
+            handler.handling_weather_recommendations, hass, spotify_mock
+        )
 
-    with patch(SPOTIFY_MOCK_PATH) as spotify_mock:
-        spotify_mock.search.return_value = {
-            "playlists": {
-                "items": [
-                    {"name": "Sunny Day Playlist 1", "id": "playlist_id_1"},
-                    {"name": "Sunny Day Playlist 2", "id": "playlist_id_2"},
-                ]
-            }
-        }
 
-        with pytest.raises(HomeAssistantError):
-            handler.handling_weather_recommendations(hass, spotify_mock)
+@pytest.fixture
+def mock_holiday_date_mapper() -> Generator[dict[str, MagicMock], None, None]:
+    """Mock the date lookups of the HolidayDateMapper."""
+    with patch.multiple(
+        HolidayDateMapper,
+        get_current_holiday=DEFAULT,
+        get_season=DEFAULT,
+        get_month=DEFAULT,
+        get_day_of_week=DEFAULT,
+    ) as mocks:
+        yield mocks
 
 
-async def test_singleton_pattern() -> None:
+@pytest.fixture
+def mock_calendar_entity_ids() -> Generator[MagicMock, None, None]:
+    """Mock a single calendar entity being set up."""
+    with patch.object(
+        RecommendationHandler,
+        "get_entity_ids",
+        return_value=["calendar.a_calendar"],
+    ) as mock_get_entity_ids:
+        yield mock_get_entity_ids
+
+
+def test_singleton_pattern() -> None:
     """Test that the RecommendationHandler follows the singleton pattern."""
     handler1 = RecommendationHandler()
     handler2 = RecommendationHandler()
     assert handler1 is handler2
 
 
-@patch(
-    "homeassistant.components.spotify.recommendation_handling.RecommendationHandler.get_entity_ids"
-)
-@patch(
-    "homeassistant.components.spotify.date_search_string.HolidayDateMapper.get_current_holiday"
-)
-@patch(
-    "homeassistant.components.spotify.date_search_string.HolidayDateMapper.get_season"
-)
-@patch(
-    "homeassistant.components.spotify.date_search_string.HolidayDateMapper.get_month"
-)
-@patch(
-    "homeassistant.components.spotify.date_search_string.HolidayDateMapper.get_day_of_week"
-)
+@pytest.mark.usefixtures("mock_calendar_entity_ids")
 async def test_generate_date_search_string(
-    mock_weekday,
-    mock_month,
-    mock_season,
-    mock_holiday,
-    mock_get_entity_ids,
     hass: HomeAssistant,
+    handler: RecommendationHandler,
+    mock_holiday_date_mapper: dict[str, MagicMock],
 ) -> None:
     """Test the connection of modules resposinble for generation of date-based search strings."""
-    mock_get_entity_ids.return_value = ["calendar.a_calendar"]
-    mock_holiday.return_value = "Christmas Eve"
-    mock_season.return_value = "Summer"
-    mock_month.return_value = "December"
-    mock_weekday.return_value = "Sunday"
+    mock_holiday_date_mapper["get_current_holiday"].return_value = "Christmas Eve"
+    mock_holiday_date_mapper["get_season"].return_value = "Summer"
+    mock_holiday_date_mapper["get_month"].return_value = "December"
+    mock_holiday_date_mapper["get_day_of_week"].return_value = "Sunday"
 
-    handler = RecommendationHandler()
     hass.data[DOMAIN] = {"spotify": {"timeframe": 7}}
 
-    with patch("homeassistant.util.dt.now") as mock_now, patch(
-        "homeassistant.components.spotify.recommendation_handling.Spotify"
-    ) as spotify_mock:
-        user: dict[str, Any] = {"country": "AU"}
-
-        assert spotify_mock
-        assert user
-
-        mock_now.return_value = dt_util.now().replace(month=12, day=25)
+    user: dict[str, Any] = {"country": "AU"}
 
-        search_string = handler._generate_date_search_string(hass, user)
+    assert handler._generate_date_search_string(hass, user) == "Christmas Eve"
 
-        assert search_string == "Christmas Eve"
 
-
-@patch(
-    "homeassistant.components.spotify.recommendation_handling.RecommendationHandler.get_entity_ids"
-)
-@patch(
-    "homeassistant.components.spotify.date_search_string.HolidayDateMapper.get_current_holiday"
-)
-@patch(
-    "homeassistant.components.spotify.date_search_string.HolidayDateMapper.get_season"
-)
-@patch(
-    "homeassistant.components.spotify.date_search_string.HolidayDateMapper.get_month"
-)
-@patch(
-    "homeassistant.components.spotify.date_search_string.HolidayDateMapper.get_day_of_week"
-)
+@pytest.mark.usefixtures("mock_calendar_entity_ids")
 async def test_generate_search_string_error_propagation(
-    mock_weekday,
-    mock_month,
-    mock_season,
-    mock_holiday,
-    mock_get_entity_ids,
     hass: HomeAssistant,
+    handler: RecommendationHandler,
+    mock_holiday_date_mapper: dict[str, MagicMock],
 ) -> None:
     """Test that raised errors are handled correctly when propagated between modules."""
-    mock_get_entity_ids.return_value = ["calendar.a_calendar"]
-    mock_holiday.return_value = NO_HOLIDAY
-    mock_season.return_value = "Summer"
-    mock_month.return_value = "July"
-    mock_weekday.return_value = "Sunday"
+    mock_holiday_date_mapper["get_current_holiday"].return_value = NO_HOLIDAY
+    mock_holiday_date_mapper["get_season"].return_value = "Summer"
+    mock_holiday_date_mapper["get_month"].return_value = "July"
+    mock_holiday_date_mapper["get_day_of_week"].return_value = "Sunday"
 
-    handler = RecommendationHandler()
     hass.data[DOMAIN] = {"spotify": {"timeframe": 7}}
 
     with pytest.raises(ValueError):
         handler._generate_date_search_string(hass, None)
 
 
-async def test_is_new_date(hass: HomeAssistant) -> None:
-    """Test the check for a new date."""
-    handler = RecommendationHandler()
-    handler._last_api_call_date = "2020-12-24"
-    hass.data[DOMAIN] = {"spotify": {"timeframe_updated": "FALSE"}}
-
-    assert handler._is_new_date(hass, "2020-12-25")
-    assert not handler._is_new_date(hass, "2020-12-24")
-
+async def test_generate_date_search_string_cached(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, handler: RecommendationHandler
+) -> None:
+    """Test that the date search string is only generated once per day."""
+    hass.data[DOMAIN] = {"timeframe_updated": "FALSE"}
+    hass.states.async_set("calendar.a_calendar", "off")
+    user: dict[str, Any] = {"country": "SE"}
 
-async def test_fetch_spotify_playlists(hass: HomeAssistant) -> None:
-    """Test fetching playlists from Spotify."""
-    with patch(SPOTIFY_MOCK_PATH) as spotify_mock:
-        spotify_mock.search.return_value = {
-            "playlists": {"items": [{"name": "Test Playlist"}]}
-        }
+    async def generate_search_string() -> str:
+        return await hass.async_add_executor_job(
+            handler._generate_date_search_string, hass, user
+        )
 
-        handler = RecommendationHandler()
-        _, items = handler._fetch_spotify_playlists(spotify_mock, "Test", "2020-12-25")
+    with patch(
+        "homeassistant.components.spotify.date_search_string.HolidayDateMapper.search_string_date",
+        return_value="Christmas Eve",
+    ) as mock_search_string_date:
+        freezer.move_to("2020-12-24 12:00:00+00:00")
 
-        assert spotify_mock.search.called
-        assert len(items) == 1
-        assert items[0]["name"] == "Test Playlist"
+        assert await generate_search_string() == "Christmas Eve"
+        assert await generate_search_string() == "Christmas Eve"
+        assert mock_search_string_date.call_count == 1
 
+        # a changed timeframe or a new date generates the search string again
+        hass.data[DOMAIN]["timeframe_updated"] = "TRUE"
+        await generate_search_string()
+        assert mock_search_string_date.call_count == 2
 
-async def test_handling_date_recommendations_with_mocked_date(
-    hass: HomeAssistant,
-) -> None:
-    """Test handling date recommendations with a mocked current date."""
-    playlist_name = "Christmas Playlist"
-    user: dict[str, Any] = {"country": "SE"}
+        hass.data[DOMAIN]["timeframe_updated"] = "FALSE"
+        freezer.move_to("2020-12-25 12:00:00+00:00")
+        await generate_search_string()
+        assert mock_search_string_date.call_count == 3
 
-    with patch(SPOTIFY_MOCK_PATH) as spotify_mock, patch.object(
-        RecommendationHandler,
-        "_generate_date_search_string",
-        return_value=playlist_name,
-    ):
-        handler = RecommendationHandler()
-        hass.data[DOMAIN] = {"spotify": {"timeframe_updated": "FALSE"}}
-
-        spotify_mock.search.return_value = {
-            "playlists": {"items": [{"name": playlist_name}]}
-        }
 
-        _, items = handler.handling_date_recommendations(spotify_mock, hass, user)
+def test_playlist_cache_expires(handler: RecommendationHandler) -> None:
+    """Test that cached playlists are only reused until they expire."""
+    key = PlaylistCacheKey("Expiring Playlist", "2020-12-25")
 
-        assert spotify_mock.search.called
-        assert spotify_mock.search.call_args[1]["q"] == playlist_name
-        assert len(items) == 1
-        assert items[0]["name"] == playlist_name
+    with patch(
+        "homeassistant.components.spotify.recommendation_handling.time.monotonic",
+        return_value=1000.0,
+    ) as mock_monotonic:
+        handler._cache_put(key, {"playlists": {}}, [{"name": "Expiring Playlist"}])
 
+        assert handler._cache_get(key) == (
+            {"playlists": {}},
+            [{"name": "Expiring Playlist"}],
+        )
+        assert (
+            handler._cache_get(PlaylistCacheKey("Expiring Playlist", "2020-12-26"))
+            is None
+        )
 
-async def test_handling_date_recommendations_empty_playlist(
-    hass: HomeAssistant,
-) -> None:
-    """Test handling date recommendations with an empty playlist response and check error message."""
-    with patch(SPOTIFY_MOCK_PATH) as spotify_mock, patch.object(
-        RecommendationHandler,
-        "_generate_date_search_string",
-        return_value="Empty Playlist",
-    ):
-        spotify_mock.search.return_value = {"playlists": {"items": []}}
+        mock_monotonic.return_value = 1000.0 + PLAYLIST_CACHE_TTL
 
-        handler = RecommendationHandler()
-        handler._last_api_call_date = ""
-        hass.data[DOMAIN] = {"spotify": {"timeframe_updated": "FALSE"}}
+        assert handler._cache_get(key) is None
 
-        with pytest.raises(HomeAssistantError) as excinfo:
-            _, _ = handler.handling_date_recommendations(
-                spotify_mock, hass, user={"country": "SE"}
-            )
-        assert "There was an issue with fetching the playlists" in str(excinfo.value)
 
+def test_cache_put_prunes_expired_errors(handler: RecommendationHandler) -> None:
+    """Test that errors past their retry time are dropped when caching playlists."""
+    expired_key = PlaylistCacheKey("Failed Playlist", "2020-12-24")
+    failing_key = PlaylistCacheKey("Failing Playlist", "2020-12-25")
+    handler._error_cache[expired_key] = (999.0, API_ERROR)
+    handler._error_cache[failing_key] = (1001.0, API_ERROR)
 
-async def test_handling_date_recommendations_api_error(hass: HomeAssistant) -> None:
-    """Test handling date recommendations with an API error."""
-    with patch(SPOTIFY_MOCK_PATH) as spotify_mock, patch.object(
-        RecommendationHandler, "_generate_date_search_string", return_value="API Error"
+    with patch(
+        "homeassistant.components.spotify.recommendation_handling.time.monotonic",
+        return_value=1000.0,
     ):
-        spotify_mock.search.side_effect = SpotifyException(
-            http_status=500, code=-1, msg="API Error"
+        handler._cache_put(
+            PlaylistCacheKey("Test Playlist", "2020-12-25"), TEST_PLAYLIST_RESPONSE, []
         )
 
-        handler = RecommendationHandler()
-        handler._last_api_call_date = "2020-06-01"
-        hass.data[DOMAIN] = {"spotify": {"timeframe_updated": "FALSE"}}
+    assert handler._error_cache == {failing_key: (1001.0, API_ERROR)}
 
-        try:
-            _, _ = handler.handling_date_recommendations(
-                spotify_mock, hass, user={"country": "SE"}
-            )
-            pytest.fail()
-        except HomeAssistantError:
-            assert spotify_mock.search.called
 
+def test_search_playlists_shares_inflight_search(
+    spotify_mock: MagicMock, handler: RecommendationHandler
+) -> None:
+    """Test that a search already in progress for the same key is reused."""
+    key = PlaylistCacheKey("Shared Playlist", "2020-12-25")
+    media = {"playlists": {"items": [{"name": "Shared Playlist"}]}}
 
-async def test_handling_date_recommendations_caching(hass: HomeAssistant) -> None:
-    """Test caching mechanism in date recommendations."""
-    with patch(SPOTIFY_MOCK_PATH) as spotify_mock, patch.object(
-        RecommendationHandler,
-        "_generate_date_search_string",
-        return_value="Winter Playlist",
-    ):
-        spotify_mock.search.return_value = {
-            "playlists": {"items": [{"name": "Winter Playlist"}]}
-        }
+    future: Future[dict[str, Any]] = Future()
+    future.set_result(media)
+    handler._inflight[key] = future
 
-        handler = RecommendationHandler()
-        hass.data[DOMAIN] = {"spotify": {"timeframe_updated": "FALSE"}}
+    assert handler._search_playlists(spotify_mock, key) is media
 
-        handler.handling_date_recommendations(
-            spotify_mock, hass, user={"country": "SE"}
-        )
+    assert not spotify_mock.search.called
 
-        spotify_mock.search.assert_called_once()
 
-        spotify_mock.search.reset_mock()
+def test_search_playlists_error_clears_inflight(
+    spotify_mock: MagicMock, handler: RecommendationHandler
+) -> None:
+    """Test that a failed search is not left in progress."""
+    key = PlaylistCacheKey("Failing Playlist", "2020-12-25")
 
-        handler.handling_date_recommendations(
-            spotify_mock, hass, user={"country": "SE"}
-        )
-        assert not spotify_mock.search.called
+    spotify_mock.search.side_effect = API_ERROR
 
+    with pytest.raises(SpotifyException):
+        handler._search_playlists(spotify_mock, key)
 
-async def test_handling_api_unexpected_response(hass: HomeAssistant) -> None:
-    """Test handling unexpected response structure from Spotify API."""
-    with patch(SPOTIFY_MOCK_PATH) as spotify_mock, patch.object(
-        RecommendationHandler,
-        "_generate_date_search_string",
-        return_value="Unexpected Response",
-    ):
-        spotify_mock.search.return_value = {"unexpected_key": "unexpected_value"}
+    assert key not in handler._inflight
 
-        handler = RecommendationHandler()
-        handler._last_api_call_date = "2023-11-20"
-        hass.data[DOMAIN] = {"spotify": {"timeframe_updated": "FALSE"}}
 
-        with pytest.raises(HomeAssistantError):
-            _, _ = handler.handling_date_recommendations(
-                spotify_mock, hass, user={"country": "SE"}
-            )
+def test_error_cached_prevents_second_call(
+    spotify_mock: MagicMock, handler: RecommendationHandler
+) -> None:
+    """Test that a rate limited search is not retried before Retry-After passes."""
+    key = PlaylistCacheKey("Rate Limited Playlist", "2020-12-25")
+
+    rate_limit_error = SpotifyException(
+        http_status=429,
+        code=-1,
+        msg="Rate Limit Exceeded",
+        headers={"Retry-After": "5"},
+    )
+    spotify_mock.search.side_effect = rate_limit_error
+
+    with patch(
+        "homeassistant.components.spotify.recommendation_handling.time.monotonic",
+        return_value=1000.0,
+    ) as mock_monotonic:
+        with pytest.raises(SpotifyException):
+            handler._search_playlists(spotify_mock, key)
+        traceback = rate_limit_error.__traceback__
+
+        with pytest.raises(SpotifyException) as excinfo:
+            handler._search_playlists(spotify_mock, key)
+
+        assert spotify_mock.search.call_count == 1
+        # The cached error is chained, not raised again
+        assert excinfo.value is not rate_limit_error
+        assert excinfo.value.__cause__ is rate_limit_error
+        assert excinfo.value.http_status == 429
+        assert rate_limit_error.__traceback__ is traceback
+
+        mock_monotonic.return_value = 1005.0
+        with pytest.raises(SpotifyException):
+            handler._search_playlists(spotify_mock, key)
+
+        assert spotify_mock.search.call_count == 2
+
+
+@pytest.mark.parametrize(
+    ("http_status", "headers", "expected"),
+    [
+        (429, {"Retry-After": "5"}, 5),
+        (429, {"Retry-After": "86400"}, MAX_RETRY_DELAY),
+        (429, {"Retry-After": "inf"}, MAX_RETRY_DELAY),
+        (429, {"Retry-After": "-5"}, RATE_LIMIT_RETRY_DELAY),
+        (429, {"Retry-After": "nan"}, RATE_LIMIT_RETRY_DELAY),
+        (429, {"Retry-After": "soon"}, RATE_LIMIT_RETRY_DELAY),
+        (429, None, RATE_LIMIT_RETRY_DELAY),
+        (500, None, SERVER_ERROR_RETRY_DELAY),
+        (503, None, SERVER_ERROR_RETRY_DELAY),
+        (404, None, None),
+    ],
+)
+def test_retry_delay(
+    http_status: int, headers: dict[str, str] | None, expected: float | None
+) -> None:
+    """Test how long failed searches are not retried."""
+    err = SpotifyException(
+        http_status=http_status, code=-1, msg="API Error", headers=headers
+    )
 
+    assert RecommendationHandler._retry_delay(err) == expected
 
-async def test_handling_different_dates(hass: HomeAssistant) -> None:
-    """Test handling different dates for recommendations."""
-    playlist_name = "Autumn Playlist"
 
-    with patch(SPOTIFY_MOCK_PATH) as spotify_mock, patch.object(
-        RecommendationHandler,
-        "_generate_date_search_string",
-        return_value=playlist_name,
-    ):
-        handler = RecommendationHandler()
-        handler._last_api_call_date = "2023-11-19"
-        hass.data[DOMAIN] = {"spotify": {"timeframe_updated": "FALSE"}}
+def test_fetch_spotify_playlists(
+    spotify_mock: MagicMock, handler: RecommendationHandler
+) -> None:
+    """Test fetching playlists from Spotify."""
+    spotify_mock.search.return_value = TEST_PLAYLIST_RESPONSE
 
-        spotify_mock.search.return_value = {
-            "playlists": {"items": [{"name": playlist_name}]}
-        }
+    _, items = handler._fetch_spotify_playlists(spotify_mock, "Test", "2020-12-25")
 
-        _, items = handler.handling_date_recommendations(
-            spotify_mock, hass, user={"country": "SE"}
-        )
+    spotify_mock.search.assert_called_once()
+    assert len(items) == 1
+    assert items[0]["name"] == "Test Playlist"
 
-        assert spotify_mock.search.called
-        assert spotify_mock.search.call_args[1]["q"] == playlist_name
-        assert len(items) == 1
-        assert items[0]["name"] == playlist_name
 
+async def test_handling_date_recommendations_with_mocked_date(
+    hass: HomeAssistant,
+    spotify_mock: MagicMock,
+    mock_date_search_string: MagicMock,
+    handler: RecommendationHandler,
+) -> None:
+    """Test handling date recommendations with a mocked current date."""
+    playlist_name = "Christmas Playlist"
+    user: dict[str, Any] = {"country": "SE"}
 
-async def test_handling_malformed_data_missing_key(hass: HomeAssistant) -> None:
-    """Test handling date recommendations with malformed data missing expected key."""
-    with patch(SPOTIFY_MOCK_PATH) as spotify_mock, patch.object(
-        RecommendationHandler,
-        "_generate_date_search_string",
-        return_value="Malformed Data",
-    ):
-        spotify_mock.search.return_value = {"playlists": {}}
+    mock_date_search_string.return_value = playlist_name
+    hass.data[DOMAIN] = {"spotify": {"timeframe_updated": "FALSE"}}
 
-        handler = RecommendationHandler()
-        handler._last_api_call_date = "2023-11-20"
-        hass.data[DOMAIN] = {"spotify": {"timeframe_updated": "FALSE"}}
+    spotify_mock.search.return_value = {
+        "playlists": {"items": [{"name": playlist_name}]}
+    }
 
-        with pytest.raises(HomeAssistantError):
-            _, _ = handler.handling_date_recommendations(
-                spotify_mock, hass, user={"country": "SE"}
-            )
+    _, items = handler.handling_date_recommendations(spotify_mock, hass, user)
 
+    assert spotify_mock.search.call_args_list == [
+        call(q=playlist_name, type="playlist", limit=BROWSE_LIMIT)
+    ]
+    assert len(items) == 1
+    assert items[0]["name"] == playlist_name
 
-async def test_handling_api_rate_limit_and_downtime(hass: HomeAssistant) -> None:
-    """Test handling API rate limit and downtime."""
-    with patch(SPOTIFY_MOCK_PATH) as spotify_mock, patch.object(
-        RecommendationHandler,
-        "_generate_date_search_string",
-        return_value="API Downtime",
-    ):
-        spotify_mock.search.side_effect = SpotifyException(
-            http_status=429, code=-1, msg="Rate Limit Exceeded"
+
+@pytest.mark.parametrize(
+    ("side_effect", "response", "message"),
+    [
+        (
+            API_ERROR,
+            None,
+            "There was an issue connecting to Spotify",
+        ),
+        (
+            RATE_LIMIT_ERROR,
+            None,
+            "There was an issue connecting to Spotify",
+        ),
+        (None, EMPTY_RESPONSE, "There was an issue with fetching the playlists"),
+        (
+            None,
+            {"unexpected_key": "unexpected_value"},
+            "There was an issue with fetching the playlists",
+        ),
+        (None, {"playlists": {}}, "There was an issue with fetching the playlists"),
+        (None, {"playlists": None}, "There was an issue with fetching the playlists"),
+        (
+            None,
+            {"playlists": {"items": None}},
+            "There was an issue with fetching the playlists",
+        ),
+        (None, None, "There was an issue with fetching the playlists"),
+    ],
+)
+@pytest.mark.usefixtures("mock_date_search_string")
+async def test_handling_date_recommendations_error(
+    hass: HomeAssistant,
+    spotify_mock: MagicMock,
+    handler: RecommendationHandler,
+    side_effect: SpotifyException | None,
+    response: dict[str, Any] | None,
+    message: str,
+) -> None:
+    """Test handling date recommendations when Spotify fails or returns no playlists."""
+    spotify_mock.search.side_effect = side_effect
+    spotify_mock.search.return_value = response
+    hass.data[DOMAIN] = {"spotify": {"timeframe_updated": "FALSE"}}
+
+    with pytest.raises(HomeAssistantError, match=message):
+        handler.handling_date_recommendations(
+            spotify_mock, hass, user={"country": "SE"}
         )
 
-        handler = RecommendationHandler()
-        handler._last_api_call_date = "2023-11-20"
-        hass.data[DOMAIN] = {"spotify": {"timeframe_updated": "FALSE"}}
+    spotify_mock.search.assert_called_once()
 
-        with pytest.raises(HomeAssistantError):
-            _, _ = handler.handling_date_recommendations(
-                spotify_mock, hass, user={"country": "SE"}
-            )
 
+@pytest.mark.usefixtures("mock_date_search_string")
+async def test_handling_date_recommendations_caching(
+    hass: HomeAssistant, spotify_mock: MagicMock, handler: RecommendationHandler
+) -> None:
+    """Test caching mechanism in date recommendations."""
+    spotify_mock.search.return_value = {
+        "playlists": {"items": [{"name": "Winter Playlist"}]}
+    }
 
-async def test_handling_excess_items_from_spotify(hass: HomeAssistant) -> None:
-    """Test handling more items than BROWSE_LIMIT from Spotify."""
-    with patch(SPOTIFY_MOCK_PATH) as spotify_mock, patch.object(
-        RecommendationHandler,
-        "_generate_date_search_string",
-        return_value="Excess Items",
-    ):
-        spotify_mock.search.return_value = {
-            "playlists": {"items": [{"name": f"Playlist {i}"} for i in range(100)]}
-        }
+    hass.data[DOMAIN] = {"spotify": {"timeframe_updated": "FALSE"}}
 
-        handler = RecommendationHandler()
-        handler._last_api_call_date = "2023-11-20"
-        hass.data[DOMAIN] = {"spotify": {"timeframe_updated": "FALSE"}}
+    handler.handling_date_recommendations(spotify_mock, hass, user={"country": "SE"})
 
-        _, items = handler.handling_date_recommendations(
-            spotify_mock, hass, user={"country": "SE"}
-        )
-        assert len(items) <= BROWSE_LIMIT
+    spotify_mock.search.assert_called_once()
 
+    spotify_mock.search.reset_mock()
 
-@patch("homeassistant.components.spotify.recommendation_handling.er.async_get")
-def test_get_entity_ids(mock_async_get, hass: HomeAssistant) -> None:
-    """Test entity id's of given domain is returned."""
+    handler.handling_date_recommendations(spotify_mock, hass, user={"country": "SE"})
+    assert not spotify_mock.search.called
 
-    mock_entity_reg = MagicMock()
-    mock_async_get.return_value = mock_entity_reg
 
-    # test with one calendar entity
+@pytest.mark.usefixtures("mock_date_search_string")
+async def test_handling_date_recommendations_new_date(
+    hass: HomeAssistant,
+    spotify_mock: MagicMock,
+    freezer: FrozenDateTimeFactory,
+    handler: RecommendationHandler,
+) -> None:
+    """Test that playlists are fetched again on a new date."""
+    spotify_mock.search.return_value = TEST_PLAYLIST_RESPONSE
 
-    mock_entity_reg.entities.values.return_value = [
-        MagicMock(
-            entity_id="an_entity_id", domain=RecommendedPlaylistDomains.CALENDAR.value
-        )
-    ]
+    hass.data[DOMAIN] = {"spotify": {"timeframe_updated": "FALSE"}}
 
-    entity_ids = RecommendationHandler.get_entity_ids(
-        hass, RecommendedPlaylistDomains.CALENDAR
-    )
+    freezer.move_to("2020-12-24 12:00:00+00:00")
+    handler.handling_date_recommendations(spotify_mock, hass, user={"country": "SE"})
 
-    mock_async_get.assert_called_once_with(hass)
-    mock_entity_reg.entities.values.assert_called_once()
-    assert len(entity_ids) == 1
+    freezer.move_to("2020-12-25 12:00:00+00:00")
+    handler.handling_date_recommendations(spotify_mock, hass, user={"country": "SE"})
 
-    # test with two entities with matching domains
+    assert spotify_mock.search.call_count == 2
 
-    mock_entity_reg.entities.values.return_value = [
-        MagicMock(
-            entity_id="an_entity_id", domain=RecommendedPlaylistDomains.CALENDAR.value
-        ),
-        MagicMock(
-            entity_id="another_entity_id",
-            domain=RecommendedPlaylistDomains.CALENDAR.value,
-        ),
-    ]
 
-    entity_ids = RecommendationHandler.get_entity_ids(
-        hass, RecommendedPlaylistDomains.CALENDAR
-    )
-    assert len(entity_ids) == 2
+async def test_handling_different_dates(
+    hass: HomeAssistant,
+    spotify_mock: MagicMock,
+    mock_date_search_string: MagicMock,
+    handler: RecommendationHandler,
+) -> None:
+    """Test handling different dates for recommendations."""
+    playlist_name = "Autumn Playlist"
 
-    # test with one matching entity domain, and two other entities (one of a non-matching domain and one with no domain)
+    mock_date_search_string.return_value = playlist_name
+    hass.data[DOMAIN] = {"spotify": {"timeframe_updated": "FALSE"}}
 
-    mock_entity_reg.entities.values.return_value = [
-        MagicMock(
-            entity_id="an_entity_id", domain=RecommendedPlaylistDomains.CALENDAR.value
-        ),
-        MagicMock(
-            entity_id="another_entity_id",
-            domain=RecommendedPlaylistDomains.WEATHER.value,
-        ),
-        MagicMock(entity_id="a_third_entity_id"),
-    ]
+    spotify_mock.search.return_value = {
+        "playlists": {"items": [{"name": playlist_name}]}
+    }
 
-    entity_ids = RecommendationHandler.get_entity_ids(
-        hass, RecommendedPlaylistDomains.CALENDAR
+    _, items = handler.handling_date_recommendations(
+        spotify_mock, hass, user={"country": "SE"}
     )
-    assert len(entity_ids) == 1
-
-    # test with no matching entity domain
 
-    mock_entity_reg.entities.values.return_value = [
-        MagicMock(
-            entity_id="an_entity_id", domain=RecommendedPlaylistDomains.WEATHER.value
-        )
+    assert spotify_mock.search.call_args_list == [
+        call(q=playlist_name, type="playlist", limit=BROWSE_LIMIT)
     ]
+    assert len(items) == 1
+    assert items[0]["name"] == playlist_name
 
-    entity_ids = RecommendationHandler.get_entity_ids(
-        hass, RecommendedPlaylistDomains.CALENDAR
-    )
-    assert len(entity_ids) == 0
 
-    # test with one weather entity
+@pytest.mark.usefixtures("mock_date_search_string")
+async def test_handling_excess_items_from_spotify(
+    hass: HomeAssistant, spotify_mock: MagicMock, handler: RecommendationHandler
+) -> None:
+    """Test handling more items than BROWSE_LIMIT from Spotify."""
+    spotify_mock.search.return_value = EXCESS_RESPONSE
 
-    mock_entity_reg.entities.values.return_value = [
-        MagicMock(
-            entity_id="an_entity_id", domain=RecommendedPlaylistDomains.WEATHER.value
-        )
-    ]
+    hass.data[DOMAIN] = {"spotify": {"timeframe_updated": "FALSE"}}
 
-    entity_ids = RecommendationHandler.get_entity_ids(
-        hass, RecommendedPlaylistDomains.WEATHER
+    _, items = handler.handling_date_recommendations(
+        spotify_mock, hass, user={"country": "SE"}
     )
-    assert len(entity_ids) == 1
-
-    # test with no entities
-
-    mock_entity_reg.entities.values.return_value = []
+    assert len(items) == BROWSE_LIMIT
+    assert spotify_mock.search.call_args.kwargs["limit"] == BROWSE_LIMIT
+
+
+@pytest.mark.parametrize(
+    ("entity_ids", "domain", "expected"),
+    [
+        ([], RecommendedPlaylistDomains.CALENDAR, []),
+        (
+            ["calendar.a_calendar"],
+            RecommendedPlaylistDomains.CALENDAR,
+            ["calendar.a_calendar"],
+        ),
+        (
+            ["calendar.a_calendar", "calendar.another_calendar", "weather.home"],
+            RecommendedPlaylistDomains.CALENDAR,
+            ["calendar.a_calendar", "calendar.another_calendar"],
+        ),
+        (
+            ["calendar.a_calendar", "calendar.another_calendar", "weather.home"],
+            RecommendedPlaylistDomains.WEATHER,
+            ["weather.home"],
+        ),
+    ],
+)
+async def test_get_entity_ids(
+    hass: HomeAssistant,
+    entity_ids: list[str],
+    domain: RecommendedPlaylistDomains,
+    expected: list[str],
+) -> None:
+    """Test entity id's of given domain is returned."""
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, "off")
 
-    entity_ids = RecommendationHandler.get_entity_ids(
-        hass, RecommendedPlaylistDomains.WEATHER
+    entity_ids = await hass.async_add_executor_job(
+        RecommendationHandler.get_entity_ids, hass, domain
     )
-    assert len(entity_ids) == 0
+    assert sorted(entity_ids) == expected
@@ -0,0 +1,50 @@
+"""Test Spotify utils."""
+import pytest
+
+from homeassistant.components.spotify.util import (
+    fetch_image_url,
+    spotify_uri_from_media_browser_url,
+)
+
+
+@pytest.mark.parametrize(
+    ("media_content_id", "expected"),
+    [
+        ("spotify://entry_id/spotify:track:abc", "spotify:track:abc"),
+        ("spotify://entry_id/spotify:track:a%20b", "spotify:track:a b"),
+        ("spotify://entry_id/spotify:track:abc?foo=bar", "spotify:track:abc"),
+        ("spotify://entry_id", ""),
+        ("spotify://entry_id/", ""),
+        ("spotify://entry_id/.", ""),
+        ("spotify://entry_id/..", ""),
+        ("spotify://entry_id/playlists/spotify:playlist:abc", "spotify:playlist:abc"),
+        ("spotify://entry_id/spotify:track:a\tb", "spotify:track:ab"),
+        ("spotify:track:abc", "spotify:track:abc"),
+        ("", ""),
+    ],
+)
+def test_spotify_uri_from_media_browser_url(
+    media_content_id: str, expected: str
+) -> None:
+    """Test extracting the Spotify URI from a media browser URL."""
+    assert spotify_uri_from_media_browser_url(media_content_id) == expected
+
+
+def test_spotify_uri_from_invalid_media_browser_url() -> None:
+    """Test extracting the Spotify URI from a media browser URL without a user."""
+    with pytest.raises(ValueError):
+        spotify_uri_from_media_browser_url("spotify://spotify:track:abc")
+
+
+@pytest.mark.parametrize(
+    ("item", "expected"),
+    [
+        ({"images": [{"url": "image_1"}, {"url": "image_2"}]}, "image_1"),
+        ({"images": [{}]}, None),
+        ({"images": []}, None),
+        ({}, None),
+    ],
+)
+def test_fetch_image_url(item: dict, expected: str | None) -> None:
+    """Test fetching the first image url of an item."""
+    assert fetch_image_url(item) == expected
@@ -1,35 +1,12 @@
 """Module for testing the WeatherPlaylistMapper functionality in the Spotify integration."""
 
-import json
+from pathlib import Path
 
 import pytest
 
 from homeassistant.components.spotify.weather_search_string import WeatherPlaylistMapper
 
-
-# Fixture to load the test JSON data
-@pytest.fixture
-def spotify_mapping_data():
-    """Fixture for creating a WeatherPlaylistMapper instance with a valid mapping file."""
-    with open(
-        "homeassistant/components/spotify/spotify_mappings.json", encoding="utf-8"
-    ) as file:
-        return json.load(file)
-
-
-# Fixture for initializing the WeatherPlaylistMapper with test data
-@pytest.fixture
-def mapper(spotify_mapping_data):
-    """Fixture for initializing the WeatherPlaylistMapper with test data."""
-    # Write the test data to a test file
-    with open(
-        "tests/components/spotify/test_spotify_mappings.json",
-        "w",
-        encoding="utf-8",
-    ) as file:
-        json.dump(spotify_mapping_data, file, indent=2)
-    # Initialize the mapper with the path to the test file
-    return WeatherPlaylistMapper("tests/components/spotify/test_spotify_mappings.json")
+from . import MAPPING_FILE
 
 
 def test_init_valid_file(mapper: WeatherPlaylistMapper) -> None:
@@ -37,123 +14,73 @@ def test_init_valid_file(mapper: WeatherPlaylistMapper) -> None:
     assert mapper.spotify_category_mapping is not None
 
 
-def test_init_invalid_file() -> None:
-    """Test initializing WeatherPlaylistMapper with an invalid mapping file."""
-    with pytest.raises(FileNotFoundError):
-        WeatherPlaylistMapper(
-            "homeassistant/components/spotify/test_spotify_mappings.json"
-        )
-
-
-def test_map_weather_to_playlists_valid_conditions(
-    mapper: WeatherPlaylistMapper,
-) -> None:
-    """Test mapping weather conditions to search string with valid conditions."""
-    search_string = mapper.map_weather_to_playlists(20, "pouring", "celsius")
-    # Expected for 'warm' 'pouring'
-    assert search_string == "Rainy Day"
+def test_mapping_file_loaded_once(mapper: WeatherPlaylistMapper) -> None:
+    """Test that mappers created from the same file share the parsed mapping."""
+    other_mapper = WeatherPlaylistMapper(MAPPING_FILE)
+    assert other_mapper.spotify_category_mapping is mapper.spotify_category_mapping
 
 
-def test_map_weather_to_playlists_invalid_condition(
-    mapper: WeatherPlaylistMapper,
-) -> None:
-    """Test mapping weather conditions to search string with an invalid condition."""
-    with pytest.raises(ValueError):
-        mapper.map_weather_to_playlists(20, "sleepy", "celsius")
-
-
-def test_map_weather_to_playlists_boundary_temperature_1(
-    mapper: WeatherPlaylistMapper,
-) -> None:
-    """Test mapping weather conditions to search string at the boundary temperature."""
-    search_string = mapper.map_weather_to_playlists(15, "cloudy", "celsius")
-    # Expected for 'warm' 'cloudy
-    assert search_string == "Cloudy Warm"
-
-
-def test_map_weather_to_playlists_boundary_temperature_2(
-    mapper: WeatherPlaylistMapper,
-) -> None:
-    """Test mapping at boundary temperature values."""
-    search_string = mapper.map_weather_to_playlists(0, "fog", "celsius")
-    # Expected for 'cold' 'fog'
-    assert search_string == "Foggy Chill"
-
-
-def test_map_weather_to_playlists_negative_temperature(
-    mapper: WeatherPlaylistMapper,
-) -> None:
-    """Test mapping with negative temperature."""
-    search_string = mapper.map_weather_to_playlists(-5, "snowy", "celsius")
-    # Expected for 'cold' 'snowy'
-    assert search_string == "Snowy"
-
-
-def test_map_weather_to_playlists_high_temperature(
-    mapper: WeatherPlaylistMapper,
-) -> None:
-    """Test mapping with high temperature."""
-    search_string = mapper.map_weather_to_playlists(35, "fog", "celsius")
-    # Expected for 'warm' 'fog'
-    assert search_string == "Foggy Morning"
-
-
-def test_map_weather_to_playlists_unusual_condition(
-    mapper: WeatherPlaylistMapper,
-) -> None:
-    """Test mapping with unusual weather condition."""
-    search_string = mapper.map_weather_to_playlists(20, "exceptional", "celsius")
-    # Expected for 'warm' 'exceptional'
-    assert search_string == "Happy"
-
-
-def test_map_weather_to_playlists_non_standard_condition_string(
-    mapper: WeatherPlaylistMapper,
-) -> None:
-    """Test mapping with non-standard condition strings."""
-    search_string = mapper.map_weather_to_playlists(20, "   SUNNY   ", "celsius")
-    # Expected for 'warm' 'sunny'
-    assert search_string == "Sunny"
-
-
-def test_upper_case_input(
-    mapper: WeatherPlaylistMapper,
-) -> None:
-    """Test condition input with only upper case letters."""
-    search_string = mapper.map_weather_to_playlists(20, "RAINY", "celsius")
-    # Expected for 'warm' 'rainy'
-    assert search_string == "Rainy Day"
-
-
-def test_map_weather_to_playlists_null_parameters(
-    mapper: WeatherPlaylistMapper,
-) -> None:
-    """Test mapping with null or missing parameters."""
-    with pytest.raises(TypeError):
-        mapper.map_weather_to_playlists(None, "sunny", "celsius")
-
-
-def test_condtion_including_special_characters(
-    mapper: WeatherPlaylistMapper,
-) -> None:
-    """Test failing when provided condition with special characters in it."""
-    with pytest.raises(ValueError):
-        mapper.map_weather_to_playlists(20, "windy?", "celsius")
-
-
-def test_map_weather_to_playlists_fahrenheit_temperature_unit_high(
+def test_init_invalid_file(tmp_path: Path) -> None:
+    """Test initializing WeatherPlaylistMapper with an invalid mapping file."""
+    with pytest.raises(FileNotFoundError):
+        WeatherPlaylistMapper(str(tmp_path / "spotify_mappings.json"))
+
+
+@pytest.mark.parametrize(
+    ("temperature", "condition", "temperature_unit", "expected"),
+    [
+        pytest.param(20, "pouring", "celsius", "Rainy Day", id="warm_pouring"),
+        pytest.param(15, "cloudy", "celsius", "Cloudy Warm", id="boundary_warm"),
+        pytest.param(0, "fog", "celsius", "Foggy Chill", id="boundary_cold"),
+        pytest.param(-5, "snowy", "celsius", "Snowy", id="negative_temperature"),
+        pytest.param(35, "fog", "celsius", "Foggy Morning", id="high_temperature"),
+        pytest.param(20, "exceptional", "celsius", "Happy", id="unusual_condition"),
+        pytest.param(20, "   SUNNY   ", "celsius", "Sunny", id="non_standard_string"),
+        pytest.param(20, "RAINY", "celsius", "Rainy Day", id="upper_case"),
+        pytest.param(68, "sunny", "fahrenheit", "Sunny", id="fahrenheit_high"),
+        pytest.param(21, "snowy", "fahrenheit", "Snowy", id="fahrenheit_low"),
+        pytest.param(
+            20, "partlycloudy-day", "celsius", "Cloudy Sunny", id="condition_variant"
+        ),
+        pytest.param(
+            5,
+            "lightning-rainy night",
+            "celsius",
+            "Relax Thunderstorm",
+            id="condition_variant_with_separators",
+        ),
+        pytest.param(10, "sunny", "°C", "Cold Sunny", id="temperature_unit_symbol"),
+    ],
+)
+def test_map_weather_to_playlists(
     mapper: WeatherPlaylistMapper,
+    temperature: float,
+    condition: str,
+    temperature_unit: str,
+    expected: str,
 ) -> None:
-    """Test mapping weather conditions to search string with Fahrenheit temperature unit (high)."""
-    search_string = mapper.map_weather_to_playlists(68, "sunny", "fahrenheit")
-    # Expected for 'warm' 'sunny'
-    assert search_string == "Sunny"
-
-
-def test_map_weather_to_playlists_fahrenheit_temperature_unit_low(
+    """Test mapping weather conditions and temperatures to a search string."""
+    assert (
+        mapper.map_weather_to_playlists(temperature, condition, temperature_unit)
+        == expected
+    )
+
+
+@pytest.mark.parametrize(
+    ("temperature", "condition", "expected_exception"),
+    [
+        pytest.param(20, "sleepy", ValueError, id="invalid_condition"),
+        pytest.param(20, "windy?", ValueError, id="special_characters"),
+        pytest.param(20, "sleepy-day", ValueError, id="unknown_condition_variant"),
+        pytest.param(None, "sunny", TypeError, id="null_temperature"),
+    ],
+)
+def test_map_weather_to_playlists_raises(
     mapper: WeatherPlaylistMapper,
+    temperature: float | None,
+    condition: str,
+    expected_exception: type[Exception],
 ) -> None:
-    """Test mapping weather conditions to search string with Fahrenheit temperature unit (low)."""
-    search_string = mapper.map_weather_to_playlists(21, "snowy", "fahrenheit")
-    # Expected for 'cold' 'snowy'
-    assert search_string == "Snowy"
+    """Test mapping fails for unknown conditions and missing temperatures."""
+    with pytest.raises(expected_exception):
+        mapper.map_weather_to_playlists(temperature, condition, "celsius")
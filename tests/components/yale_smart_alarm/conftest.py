@@ -6,7 +6,6 @@ from typing import Any
 from unittest.mock import Mock, patch
 
 import pytest
-from yalesmartalarmclient.const import YALE_STATE_ARM_FULL
 
 from homeassistant.components.yale_smart_alarm.const import DOMAIN
 from homeassistant.config_entries import SOURCE_USER
@@ -48,7 +47,6 @@ async def load_config_entry(
         client.auth = None
         client.lock_api = None
         client.get_all.return_value = load_json
-        client.get_armed_status.return_value = YALE_STATE_ARM_FULL
         await hass.config_entries.async_setup(config_entry.entry_id)
         await hass.async_block_till_done()
 
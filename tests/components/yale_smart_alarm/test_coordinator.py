@@ -6,10 +6,9 @@ from typing import Any
 from unittest.mock import Mock, patch
 
 import pytest
-from yalesmartalarmclient.const import YALE_STATE_ARM_FULL
 from yalesmartalarmclient.exceptions import AuthenticationError, UnknownError
 
-from homeassistant.components.yale_smart_alarm.const import DOMAIN
+from homeassistant.components.yale_smart_alarm.const import COORDINATOR, DOMAIN
 from homeassistant.config_entries import SOURCE_USER
 from homeassistant.const import STATE_ALARM_ARMED_AWAY, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant
@@ -71,6 +70,7 @@ async def test_coordinator_setup_and_update_errors(
 
     state = hass.states.get("alarm_control_panel.yale_smart_alarm")
     assert state.state == STATE_ALARM_ARMED_AWAY
+    client.get_armed_status.assert_not_called()
     client.reset_mock()
 
     client.get_all.side_effect = ConnectionError("Could not connect")
@@ -107,7 +107,6 @@ async def test_coordinator_setup_and_update_errors(
 
     client.get_all.side_effect = None
     client.get_all.return_value = load_json
-    client.get_armed_status.return_value = YALE_STATE_ARM_FULL
     async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=5))
     await hass.async_block_till_done()
     client.get_all.assert_called_once()
@@ -121,3 +120,73 @@ async def test_coordinator_setup_and_update_errors(
     client.get_all.assert_called_once()
     state = hass.states.get("alarm_control_panel.yale_smart_alarm")
     assert state.state == STATE_UNAVAILABLE
+
+
+async def test_coordinator_device_states(
+    hass: HomeAssistant,
+    load_config_entry: tuple[MockConfigEntry, Mock],
+) -> None:
+    """Test the Yale Smart Living coordinator resolves lock and contact states."""
+
+    entry = load_config_entry[0]
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+
+    assert [
+        (lock.name, lock.state, lock.state2) for lock in coordinator.data["locks"]
+    ] == [
+        ("Device1", "locked", "closed"),
+        ("Device2", "unlocked", "unknown"),
+        ("Device3", "locked", "unknown"),
+        ("Device7", "unlocked", "closed"),
+        ("Device8", "unlocked", "open"),
+        ("Device9", "unavailable", None),
+    ]
+    assert [
+        (contact.name, contact.state) for contact in coordinator.data["door_windows"]
+    ] == [
+        ("Device4", "closed"),
+        ("Device5", "open"),
+        ("Device6", "unavailable"),
+    ]
+    assert coordinator.data["lock_map"] == {
+        "1111": "locked",
+        "2222": "unlocked",
+        "3333": "locked",
+        "7777": "unlocked",
+        "8888": "unlocked",
+        "9999": "unavailable",
+    }
+    assert coordinator.data["sensor_map"] == {
+        "RF4": "closed",
+        "RF5": "open",
+        "RF6": "unavailable",
+    }
+
+
+@pytest.mark.parametrize(
+    ("lock_status", "expected"),
+    [
+        ("35", ("locked", "closed")),
+        (35, ("locked", "closed")),
+        (4, ("unlocked", "open")),
+        ("", ("locked", "unknown")),
+        (None, ("locked", "unknown")),
+    ],
+)
+async def test_coordinator_process_door_lock_status(
+    hass: HomeAssistant,
+    load_config_entry: tuple[MockConfigEntry, Mock],
+    lock_status: str | int | None,
+    expected: tuple[str, str | None],
+) -> None:
+    """Test the Yale Smart Living coordinator parses string and int lock statuses."""
+
+    entry = load_config_entry[0]
+    coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+
+    lock = coordinator.process_door_lock(
+        {"address": "1111", "name": "Device1", "minigw_lock_status": lock_status},
+        "device_status.lock",
+    )
+
+    assert (lock.state, lock.state2) == expected